@@ -8,21 +8,24 @@ Endpoints:
   GET    /<agent_id>           — get agent info
   PUT    /<agent_id>           — update agent info
   POST   /<agent_id>/commands  — send command
+  POST   /commands/batch       — send commands to several agents
   GET    /tasks/<task_id>      — get task status
   DELETE /<agent_id>           — delete agent
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
 from flask import Blueprint, request
 
+from app.logger import logger
+
 from shared.response import success_response, error_response
 from shared.pagination import get_pagination_params, paginated_response
 from shared import error_codes as EC
-from shared.validation import AgentCreateRequest, CommandRequest, AgentUpdateRequest
+from shared.validation import (
+    AgentCreateRequest,
+    AgentUpdateRequest,
+    BatchCommandRequest,
+    CommandRequest,
+)
 
 from agent_server.app.services.agent_service import agent_service
 from agent_server.app.services.task_service import task_service
@@ -38,7 +41,7 @@ def agent_create(user_id):
     data = request.get_json() or {}
 
     try:
-        req = AgentCreateRequest(**data)
+        req = AgentCreateRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
@@ -53,12 +56,9 @@ def agent_create(user_id):
 
     if success:
         return success_response(result, 201)
-    # Map error strings to codes
-    err = result.get("error", "Unknown error")
-    code = EC.INVALID_AGENT_TYPE if "Invalid agent_type" in err else EC.VALIDATION_ERROR
-    if "not found" in err.lower():
-        code = EC.OWNER_NOT_FOUND
-    return error_response(code, err)
+    return error_response(
+        result.get("code", EC.VALIDATION_ERROR), result.get("error", "Unknown error")
+    )
 
 
 @agent_bp.route("/<agent_id>", methods=["GET"])
@@ -68,7 +68,7 @@ def get_agent_info(agent_id, user_id):
     info = agent_service.get_agent_info(agent_id)
     if info:
         return success_response({"agent": info})
-    return error_response(EC.AGENT_NOT_FOUND, f"Agent {agent_id} not found", 404)
+    return error_response(EC.AGENT_NOT_FOUND, "Agent not found", 404, {"agent_id": agent_id})
 
 
 @agent_bp.route("/<agent_id>", methods=["PUT"])
@@ -78,7 +78,7 @@ def update_agent_info(agent_id, user_id):
     data = request.get_json() or {}
 
     try:
-        req = AgentUpdateRequest(**data)
+        req = AgentUpdateRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
@@ -95,17 +95,31 @@ def send_cmd(agent_id, user_id):
     data = request.get_json() or {}
 
     try:
-        req = CommandRequest(**data)
+        req = CommandRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
-    if not agent_service.get_agent_info(agent_id):
-        return error_response(EC.AGENT_NOT_FOUND, f"Agent {agent_id} not found", 404)
-
-    task_id = task_service.submit_command(agent_id, req.command)
+    task_id, _ = task_service.submit_command(agent_id, req.command)
+    if task_id is None:
+        return error_response(EC.AGENT_NOT_FOUND, "Agent not found", 404, {"agent_id": agent_id})
     return success_response({"task_id": task_id})
 
 
+@agent_bp.route("/commands/batch", methods=["POST"])
+@require_api_key
+def send_cmd_batch(user_id):
+    """Send commands to several agents in one request (async execution)."""
+    data = request.get_json() or {}
+
+    try:
+        req = BatchCommandRequest.model_validate(data)
+    except Exception as e:
+        return error_response(EC.VALIDATION_ERROR, str(e))
+
+    results = task_service.submit_commands([(c.agent_id, c.command) for c in req.commands])
+    return success_response({"tasks": results})
+
+
 @agent_bp.route("/tasks/<task_id>", methods=["GET"])
 @require_api_key
 def get_task_status(task_id, user_id):
@@ -130,8 +144,6 @@ def delete_agent(agent_id, user_id):
 def internal_machine_command(machine_id):
     """Internal endpoint for MCP Server to dispatch commands to Machine Agents.
     No API key auth required — service-to-service only."""
-    from app.logger import logger
-
     data = request.get_json() or {}
     command = data.get("command", "")
     offline = data.get("offline", False)
@@ -139,13 +151,14 @@ def internal_machine_command(machine_id):
     if not command:
         return error_response(EC.VALIDATION_ERROR, "command is required")
 
-    if not agent_service.get_agent_info(machine_id):
-        return error_response(EC.AGENT_NOT_FOUND, f"Machine {machine_id} not found", 404)
-
     if offline:
-        task_id = task_service.submit_command(machine_id, command)
+        task_id, _ = task_service.submit_command(machine_id, command)
+        if task_id is None:
+            return error_response(EC.AGENT_NOT_FOUND, "Agent not found", 404, {"agent_id": machine_id})
         return success_response({"job_id": task_id})
     else:
+        if not agent_service.exists(machine_id):
+            return error_response(EC.AGENT_NOT_FOUND, "Machine not found", 404, {"agent_id": machine_id})
         success, result = agent_service.send_command(machine_id, command)
         if success:
             return success_response({"result": result})
@@ -156,17 +169,10 @@ def internal_machine_command(machine_id):
 @require_api_key
 def list_agents(user_id):
     """List all agents (paginated)."""
-    from app.logger import logger
-
     logger.info(f"List agents request, user_id={user_id}")
     try:
-        agents = agent_service.get_all_agents()
-        all_agents = list(agents.values()) if isinstance(agents, dict) else agents
-        total = len(all_agents)
-
         page, limit = get_pagination_params()
-        start = (page - 1) * limit
-        items = all_agents[start : start + limit]
+        items, total = agent_service.get_agents_page((page - 1) * limit, limit)
 
         return success_response(paginated_response(items, total, page, limit))
     except Exception as e:
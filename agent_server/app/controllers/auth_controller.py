@@ -1,11 +1,6 @@
 # -*- coding: utf-8 -*-
 """Auth Controller — user registration and API key verification."""
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
 from flask import Blueprint, request
 
 from shared.response import success_response, error_response
@@ -22,7 +17,7 @@ def register():
     data = request.get_json() or {}
 
     try:
-        req = RegisterRequest(**data)
+        req = RegisterRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
@@ -6,21 +6,35 @@ Proxies selected World Server endpoints through the Agent Server,
 adding authentication.
 """
 
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+import time
+from threading import Lock
+from typing import Dict, Tuple
 
 import requests
-from flask import Blueprint, request as flask_request
+from requests.adapters import HTTPAdapter
+from flask import Blueprint, Response, request as flask_request
 
 from shared.response import success_response, error_response
 from shared import error_codes as EC
 from agent_server.app.utils.auth_decorator import require_api_key
-from agent_server.app.config import config
+from agent_server.app.config import WORLD_SERVER_URL, config
 
 proxy_bp = Blueprint("proxy", __name__, url_prefix="/api/v1/world")
 
+_WORLD_VIEW_URL = f"{WORLD_SERVER_URL}/api/v1/world/view"
+
+# Keep-alive connection pool to World Server, shared by all proxied requests
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=0)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+# Fog-of-war views per human_id: (monotonic time, body). Polling clients
+# within one WORLD_VIEW_CACHE_TTL window share a single World Server fetch.
+_VIEW_CACHE_MAX = 1024
+_view_cache: Dict[str, Tuple[float, bytes]] = {}
+_view_cache_lock = Lock()
+
 
 @proxy_bp.route("/view", methods=["GET"])
 @require_api_key
@@ -30,14 +44,25 @@ def proxy_view(user_id):
     if not human_id:
         return error_response(EC.VALIDATION_ERROR, "human_id query parameter is required")
 
+    now = time.monotonic()
+    cached = _view_cache.get(human_id)
+    if cached and now - cached[0] < config.WORLD_VIEW_CACHE_TTL:
+        return Response(cached[1], mimetype="application/json")
+
     try:
-        resp = requests.get(
-            f"{config.WORLD_SERVER_URL}/api/v1/world/view",
+        resp = _session.get(
+            _WORLD_VIEW_URL,
             params={"human_id": human_id},
             timeout=5,
         )
-        data = resp.json()
-        # Forward the World Server response as-is (already in unified format)
-        return data, resp.status_code
+        # Only successful views are cached; errors are always re-fetched
+        if resp.status_code == 200:
+            with _view_cache_lock:
+                if len(_view_cache) >= _VIEW_CACHE_MAX:
+                    _view_cache.pop(next(iter(_view_cache)))
+                _view_cache[human_id] = (now, resp.content)
+        # Forward the World Server body untouched (already in unified format),
+        # skipping a JSON decode/encode round-trip on every call
+        return Response(resp.content, status=resp.status_code, mimetype="application/json")
     except requests.exceptions.RequestException as e:
         return error_response(EC.INTERNAL_ERROR, f"World Server unreachable: {e}", 502)
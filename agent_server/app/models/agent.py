@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 """Agent Data Models"""
 
+from enum import Enum
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
 
-@dataclass
+class AgentType(str, Enum):
+    """Agent kinds; members compare and hash equal to their plain-string values"""
+    HUMAN = "human"
+    MACHINE = "machine"
+
+
+@dataclass(slots=True)
 class AgentInfo:
     """Agent Base Information"""
     agent_id: str
@@ -22,7 +29,7 @@ class AgentInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HumanInfo(AgentInfo):
     """Human Agent Information"""
     machine_ids: List[str] = field(default_factory=list)
@@ -31,12 +38,13 @@ class HumanInfo(AgentInfo):
         self.agent_type = "human"
 
     def to_dict(self) -> dict:
-        result = super().to_dict()
+        # Explicit base call: zero-arg super() breaks in slots=True dataclasses
+        result = AgentInfo.to_dict(self)
         result["machine_ids"] = self.machine_ids
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineInfo:
     """Machine Agent Information"""
     agent_id: str
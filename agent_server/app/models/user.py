@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User Information"""
     user_id: str  # Unique user ID
@@ -14,12 +14,22 @@ class User:
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict = field(default_factory=dict)
     human_id: Optional[str] = None  # Associated Human ID
+    # created_at never changes, so format it once instead of on every to_dict()
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._created_at_iso = self.created_at.isoformat()
+
+    @property
+    def created_at_iso(self) -> str:
+        """ISO-8601 creation time, formatted once at construction"""
+        return self._created_at_iso
 
     def to_dict(self) -> dict:
         return {
             "user_id": self.user_id,
             "api_key": self.api_key,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_iso,
             "metadata": self.metadata,
             "human_id": self.human_id
         }
@@ -6,14 +6,39 @@ Provides a unified external interface for Agent (Human/Machine) management.
 Internally delegates to HumanManager and MachineManager.
 """
 
+import functools
+import time
 from threading import Lock
 from typing import Dict, List, Optional, Tuple
 
 from app.logger import logger
+from shared import error_codes as EC
 
+from ..config import config
+from ..models.agent import AgentType
+from .auth_service import auth_service
 from .human_manager import human_manager
 from .machine_manager import machine_manager
 
+# Upper bound on per-agent entries kept in the info cache
+_AGENT_INFO_CACHE_MAX = 1024
+
+# Fixed failure results, shared across calls (callers only read them)
+_ERR_MISSING_FIELDS = (False, {"error": "agent_type and agent_id are required", "code": EC.VALIDATION_ERROR})
+_ERR_NO_OWNER = (False, {"error": "owner_id is required for machine", "code": EC.VALIDATION_ERROR})
+
+
+def _invalidates_cache(method):
+    """Clear the read caches before and after a mutating AgentService method"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate_cache()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_cache()
+    return wrapper
+
 
 class AgentService:
     """
@@ -23,20 +48,27 @@ class AgentService:
     to specialized Managers.
     """
 
-    _instance = None
-    _lock = Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = (
+        "_cache_ttl", "_cache_lock", "_cache_generation", "_all_agents_cache", "_agent_info_cache"
+    )
 
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-        self._initialized = True
+        # Short-lived read caches, cleared on every create/update/delete
+        self._cache_ttl = config.AGENT_CACHE_TTL
+        self._cache_lock = Lock()
+        # Bumped on every invalidation; a read only caches its result if no
+        # invalidation happened while it was fetching, so it cannot re-cache
+        # state from before a concurrent mutation
+        self._cache_generation = 0
+        self._all_agents_cache: Optional[Tuple[float, Dict[str, dict]]] = None
+        self._agent_info_cache: Dict[str, Tuple[float, dict]] = {}
+
+    def _invalidate_cache(self):
+        """Drop cached agent info around any mutation"""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._all_agents_cache = None
+            self._agent_info_cache.clear()
 
     # ==================== Unified Creation Interface ====================
 
@@ -62,21 +94,33 @@ class AgentService:
 
         Returns:
             (success, result_dict)
+            On failure result_dict is {"error": message, "code": error_code}
         """
         if not agent_type or not agent_id:
-            return False, {"error": "agent_type and agent_id are required"}
-
-        if agent_type == "human":
-            return self._create_human_with_machines(agent_id, machine_count, user_id)
-
-        elif agent_type == "machine":
-            if not owner_id:
-                return False, {"error": "owner_id is required for machine"}
-            return self._create_machine(agent_id, owner_id, position)
-
-        else:
-            return False, {"error": f"Invalid agent_type: {agent_type}"}
-
+            return _ERR_MISSING_FIELDS
+
+        creator = self._CREATORS.get(agent_type)
+        if creator is None:
+            return False, {"error": f"Invalid agent_type: {agent_type}", "code": EC.INVALID_AGENT_TYPE}
+        return creator(self, agent_id, owner_id, machine_count, position, user_id)
+
+    def _create_human_entry(self, agent_id, owner_id, machine_count, position, user_id):
+        """create_agent handler for agent_type "human" """
+        return self._create_human_with_machines(agent_id, machine_count, user_id)
+
+    def _create_machine_entry(self, agent_id, owner_id, machine_count, position, user_id):
+        """create_agent handler for agent_type "machine" """
+        if not owner_id:
+            return _ERR_NO_OWNER
+        return self._create_machine(agent_id, owner_id, position)
+
+    # agent_type -> creation handler; add new agent types here
+    _CREATORS = {
+        AgentType.HUMAN: _create_human_entry,
+        AgentType.MACHINE: _create_machine_entry,
+    }
+
+    @_invalidates_cache
     def _create_human_with_machines(
         self,
         human_id: str,
@@ -87,29 +131,30 @@ class AgentService:
         # Create Human
         success, error = human_manager.create(human_id, machine_count)
         if not success:
-            return False, {"error": error}
+            return False, {"error": error, "code": EC.VALIDATION_ERROR}
 
         # Establish user_id mapping
         if user_id:
             self._set_user_human_mapping(user_id, human_id)
 
-        # Create machines
-        actual_count = 0
-        for i in range(machine_count):
-            machine_id = f"{human_id}_robot_{i+1:02d}"
-            m_success, m_error = machine_manager.create(machine_id, human_id)
+        # Create machines in one batch, then register them with the Human at once
+        robot_id = (human_id.replace("%", "%%") + "_robot_%02d").__mod__
+        machine_ids = [robot_id(i) for i in range(1, machine_count + 1)]
+        created = []
+        for machine_id, m_success, m_error in machine_manager.create_batch(machine_ids, human_id):
             if m_success:
-                human_manager.add_machine(human_id, machine_id)
-                actual_count += 1
+                created.append(machine_id)
             else:
                 logger.warning(f"Robot {machine_id} creation failed: {m_error}")
+        human_manager.add_machines(human_id, created)
 
         return True, {
             "agent_id": human_id,
             "agent_type": "human",
-            "machine_count": actual_count
+            "machine_count": len(created)
         }
 
+    @_invalidates_cache
     def _create_machine(
         self,
         machine_id: str,
@@ -118,11 +163,11 @@ class AgentService:
     ) -> Tuple[bool, dict]:
         """Create a single machine"""
         if not human_manager.exists(owner_id):
-            return False, {"error": f"Owner {owner_id} not found"}
+            return False, {"error": f"Owner {owner_id} not found", "code": EC.OWNER_NOT_FOUND}
 
         success, error = machine_manager.create(machine_id, owner_id, position)
         if not success:
-            return False, {"error": error}
+            return False, {"error": error, "code": EC.VALIDATION_ERROR}
 
         human_manager.add_machine(owner_id, machine_id)
 
@@ -135,7 +180,6 @@ class AgentService:
     def _set_user_human_mapping(self, user_id: str, human_id: str):
         """Establish mapping between user_id and human_id"""
         try:
-            from .auth_service import auth_service
             auth_service.set_user_human_mapping(user_id, human_id)
         except Exception as e:
             logger.warning(f"Failed to establish user_id to human_id mapping: {e}")
@@ -143,50 +187,96 @@ class AgentService:
     # ==================== Query Interface ====================
 
     def get_agent_info(self, agent_id: str) -> Optional[dict]:
-        """Get Agent information"""
-        # Check Human first
-        info = human_manager.get_info(agent_id)
+        """Get Agent information (served from cache for up to AGENT_CACHE_TTL seconds)"""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._agent_info_cache.get(agent_id)
+            generation = self._cache_generation
+        if cached and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        # Check Human first, then Machine
+        info = human_manager.get_info(agent_id) or machine_manager.get_info(agent_id)
         if info:
-            return info
-
-        # Then check Machine
-        return machine_manager.get_info(agent_id)
+            with self._cache_lock:
+                if generation != self._cache_generation:
+                    return info
+                if len(self._agent_info_cache) >= _AGENT_INFO_CACHE_MAX:
+                    self._agent_info_cache.pop(next(iter(self._agent_info_cache)))
+                self._agent_info_cache[agent_id] = (now, info)
+        return info
+
+    def exists(self, agent_id: str) -> bool:
+        """Check if an Agent exists (local lookup, no World Server call)"""
+        return self._locate(agent_id) is not None
+
+    def _locate(self, agent_id: str) -> Optional[AgentType]:
+        """Return the AgentType of an Agent ID, or None (local lookup only)"""
+        if human_manager.exists(agent_id):
+            return AgentType.HUMAN
+        if machine_manager.exists(agent_id):
+            return AgentType.MACHINE
+        return None
 
     def get_all_agents(self) -> Dict[str, dict]:
-        """Get all Agent information"""
-        from app.logger import logger
-        logger.info("Starting to retrieve all Agent information")
-        result = {}
-        try:
-            logger.info("Retrieving all Human information")
-            human_result = human_manager.get_all()
-            result.update(human_result)
-            logger.info(f"Retrieved {len(human_result)} Human(s)")
-        except Exception as e:
-            logger.error(f"Failed to retrieve Human information: {e}", exc_info=True)
+        """Get all Agent information (served from cache for up to AGENT_CACHE_TTL seconds)"""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._all_agents_cache
+            generation = self._cache_generation
+        if cached and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        # Managers handle their own failures (if the World Server snapshot
+        # cannot be fetched, MachineManager logs it and returns no machines),
+        # so no extra guard is needed here
+        result = {**human_manager.get_all(), **machine_manager.get_all()}
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._all_agents_cache = (now, result)
+        return result
 
-        try:
-            logger.info("Retrieving all Machine information")
-            machines = machine_manager.get_all()
-            result.update(machines)
-            logger.info(f"Retrieved {len(machines)} Machine(s)")
-        except Exception as e:
-            logger.error(f"Failed to retrieve Machine information: {e}", exc_info=True)
+    def get_agents_page(self, offset: int, limit: int) -> Tuple[List[dict], int]:
+        """
+        Get one page of Agent information
 
-        logger.info(f"Total of {len(result)} Agent(s) retrieved")
-        return result
+        Only the agents on the requested page are materialized; machine
+        state is fetched from World Server for that page alone.
+
+        Returns:
+            (items, total)
+        """
+        human_ids = human_manager.get_ids()
+        machine_ids = machine_manager.get_ids()
+        total = len(human_ids) + len(machine_ids)
+
+        page_humans = human_ids[offset:offset + limit]
+        machine_offset = max(0, offset - len(human_ids))
+        page_machines = machine_ids[machine_offset:machine_offset + limit - len(page_humans)]
+
+        items = []
+        for human_id in page_humans:
+            info = human_manager.get_info(human_id)
+            if info:
+                items.append(info)
+        if page_machines:
+            items.extend(machine_manager.get_many(page_machines).values())
+        return items, total
 
     # ==================== Update Interface ====================
 
+    @_invalidates_cache
     def update_agent_info(self, agent_id: str, updates: dict) -> Tuple[bool, str]:
         """Update Agent information"""
+        kind = self._locate(agent_id)
+
         # Human update
-        if human_manager.exists(agent_id):
+        if kind is AgentType.HUMAN:
             # Human currently only supports metadata updates
             return True, ""
 
         # Machine update
-        if machine_manager.exists(agent_id):
+        if kind is AgentType.MACHINE:
             if 'position' in updates:
                 success, error = machine_manager.update_position(agent_id, updates['position'])
                 if not success:
@@ -207,34 +297,47 @@ class AgentService:
 
     def send_command(self, agent_id: str, command: str) -> Tuple[bool, str]:
         """Send a command to an Agent"""
+        kind = self._locate(agent_id)
+
         # Human command
-        if human_manager.exists(agent_id):
+        if kind is AgentType.HUMAN:
             return human_manager.send_command(agent_id, command)
 
         # Machine command
-        if machine_manager.exists(agent_id):
+        if kind is AgentType.MACHINE:
             return machine_manager.send_command(agent_id, command)
 
         return False, f"Agent {agent_id} not found"
 
+    async def send_command_async(self, agent_id: str, command: str) -> Tuple[bool, str]:
+        """Send a command to an Agent; must run on the agent's pinned event loop"""
+        kind = self._locate(agent_id)
+
+        if kind is AgentType.HUMAN:
+            return await human_manager.send_command_async(agent_id, command)
+
+        if kind is AgentType.MACHINE:
+            return await machine_manager.send_command_async(agent_id, command)
+
+        return False, f"Agent {agent_id} not found"
+
     # ==================== Delete Interface ====================
 
+    @_invalidates_cache
     def delete_agent(self, agent_id: str) -> Tuple[bool, str]:
         """Delete an Agent"""
-        # Human deletion
-        if human_manager.exists(agent_id):
-            # First get the list of associated machines
-            machine_ids = human_manager.get_machines(agent_id)
+        kind = self._locate(agent_id)
 
-            # Delete all associated machines
-            for m_id in machine_ids:
-                machine_manager.delete(m_id)
+        # Human deletion
+        if kind is AgentType.HUMAN:
+            # Detach the associated machines (hands over the list, no copy) and delete them
+            machine_manager.delete_batch(human_manager.detach_machines(agent_id))
 
             # Delete Human
             return human_manager.delete(agent_id)
 
         # Machine deletion
-        if machine_manager.exists(agent_id):
+        if kind is AgentType.MACHINE:
             # Remove from the owning Human's list
             info = machine_manager.get_info(agent_id)
             if info:
@@ -3,48 +3,39 @@
 Authentication Service - Manages user registration and API Key verification
 """
 
-import secrets
-import uuid
+import base64
+import os
 from typing import Dict, Optional, Tuple
 from threading import Lock
-from datetime import datetime
 
 from agent_server.app.models.user import User
-import sys
-import os
-# Add project root directory
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
 from app.logger import logger
 
 
 class AuthService:
-    """Authentication Service - Singleton"""
-
-    _instance: Optional["AuthService"] = None
-    _lock = Lock()
+    """Authentication Service - use the module-level `auth_service` instance"""
 
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = (
+        "_users_by_key",
+        "_users_by_id",
+        "_user_human_mapping",
+        "_human_user_mapping",
+        "_data_lock",
+    )
 
     def __init__(self):
-        if hasattr(self, 'initialized'):
-            return
-
         # Store user data: api_key -> User
         self._users_by_key: Dict[str, User] = {}
         # user_id -> User mapping
         self._users_by_id: Dict[str, User] = {}
         # user_id -> human_id mapping
         self._user_human_mapping: Dict[str, str] = {}
+        # human_id -> user_id reverse mapping (kept in lock-step with the above)
+        self._human_user_mapping: Dict[str, str] = {}
+        # Serializes writers only. Readers use plain dict.get, which is atomic
+        # under the GIL and never observes a half-applied single-key insert.
         self._data_lock = Lock()
 
-        self.initialized = True
-
     def register(self, metadata: Dict = None) -> Tuple[bool, Dict]:
         """
         Register a new user
@@ -59,11 +50,14 @@ class AuthService:
             - success=False: {"error": str}
         """
         try:
-            # Generate unique user ID
-            user_id = f"user_{uuid.uuid4().hex[:12]}"
+            # One entropy read feeds both identifiers
+            raw = os.urandom(40)
+
+            # Generate unique user ID (12 hex chars)
+            user_id = "user_" + raw[:6].hex()
 
             # Generate API Key (similar to OpenAI format: sk-...)
-            api_key = f"sk-{secrets.token_urlsafe(32)}"
+            api_key = "sk-" + base64.urlsafe_b64encode(raw[6:]).rstrip(b"=").decode("ascii")
 
             # Create user
             user = User(
@@ -81,7 +75,7 @@ class AuthService:
             return True, {
                 "user_id": user_id,
                 "api_key": api_key,
-                "created_at": user.created_at.isoformat(),
+                "created_at": user.created_at_iso,
                 "metadata": user.metadata
             }
 
@@ -102,22 +96,19 @@ class AuthService:
         if not api_key:
             return False, None
 
-        with self._data_lock:
-            user = self._users_by_key.get(api_key)
-            if user:
-                return True, user.user_id
+        user = self._users_by_key.get(api_key)
+        if user:
+            return True, user.user_id
 
         return False, None
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get user information by user_id"""
-        with self._data_lock:
-            return self._users_by_id.get(user_id)
+        return self._users_by_id.get(user_id)
 
     def get_user_by_api_key(self, api_key: str) -> Optional[User]:
         """Get user information by api_key"""
-        with self._data_lock:
-            return self._users_by_key.get(api_key)
+        return self._users_by_key.get(api_key)
 
     def set_user_human_mapping(self, user_id: str, human_id: str) -> bool:
         """
@@ -134,23 +125,23 @@ class AuthService:
             if user_id not in self._users_by_id:
                 return False
 
+            previous_human_id = self._user_human_mapping.get(user_id)
+            if previous_human_id is not None and previous_human_id != human_id:
+                self._human_user_mapping.pop(previous_human_id, None)
+
             self._user_human_mapping[user_id] = human_id
+            self._human_user_mapping[human_id] = user_id
             self._users_by_id[user_id].human_id = human_id
             logger.info(f"Mapping established: user_id={user_id} -> human_id={human_id}")
             return True
 
     def get_human_id_by_user_id(self, user_id: str) -> Optional[str]:
         """Get the associated human_id by user_id"""
-        with self._data_lock:
-            return self._user_human_mapping.get(user_id)
+        return self._user_human_mapping.get(user_id)
 
     def get_user_id_by_human_id(self, human_id: str) -> Optional[str]:
         """Get the associated user_id by human_id"""
-        with self._data_lock:
-            for uid, hid in self._user_human_mapping.items():
-                if hid == human_id:
-                    return uid
-            return None
+        return self._human_user_mapping.get(human_id)
 
 
 # Global instance
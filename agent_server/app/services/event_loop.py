@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Event Loops - Shared background asyncio loops
+
+Agent coroutines (initialize / run / cleanup) are submitted to a small
+pool of long-lived loops, each running in its own daemon thread, instead
+of building and tearing down a new loop with asyncio.run() on every call.
+Command tasks are scheduled on the same loops as coroutines, so running
+one needs no extra worker thread.
+
+Each agent is pinned to one loop (by agent ID), so the sessions and
+transports it opens stay bound to the loop that created them. Several
+loops are kept because agent code still makes blocking HTTP calls inside
+coroutines; a single loop would serialize every agent behind them.
+
+The API server may run under gevent monkey-patching (threads and queues
+left unpatched). The loops are therefore always hosted on real OS threads
+with the stdlib selector: as greenlets they would share the hub's thread,
+and every loop after the first would fail with "Cannot run the event loop
+while another loop is running". A greenlet waiting for a result parks on a
+gevent Event instead of blocking the hub.
+"""
+
+import asyncio
+import selectors
+import zlib
+from concurrent.futures import Future, wait
+from typing import Any, Coroutine, List, Optional, TypeVar
+
+from app.logger import logger
+
+from ..config import config
+
+try:
+    from gevent.event import Event as _GeventEvent
+    from gevent.monkey import get_original, is_module_patched
+except ImportError:  # gevent is optional for the --dev server
+    from _thread import start_new_thread as _start_new_thread
+
+    _GeventEvent = None
+    _Selector = selectors.DefaultSelector
+else:
+    # The originals still give an OS thread and a real selector after patch_all()
+    _start_new_thread = get_original("_thread", "start_new_thread")
+    _Selector = get_original("selectors", "DefaultSelector")
+
+T = TypeVar("T")
+
+
+def _run_loop(index: int, loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    except BaseException:
+        logger.exception(f"Agent event loop {index} stopped")
+    finally:
+        # A closed loop makes submit_coro fail fast instead of queueing forever
+        loop.close()
+
+
+def _start_loop(index: int) -> asyncio.AbstractEventLoop:
+    loop = asyncio.SelectorEventLoop(_Selector())
+    _start_new_thread(_run_loop, (index, loop))
+    return loop
+
+
+_loops: List[asyncio.AbstractEventLoop] = [
+    _start_loop(i) for i in range(config.AGENT_EVENT_LOOPS)
+]
+
+
+def submit_coro(agent_id: str, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+    """
+    Schedule an agent's coroutine on its pinned loop without waiting for it
+
+    Raises:
+        RuntimeError: the agent's loop has stopped
+    """
+    index = zlib.crc32(agent_id.encode()) % len(_loops)
+    loop = _loops[index]
+    if loop.is_closed():
+        coro.close()
+        raise RuntimeError(f"Agent event loop {index} is not running")
+    return asyncio.run_coroutine_threadsafe(coro, loop)
+
+
+def wait_future(future: "Future[T]", timeout: Optional[float] = None) -> T:
+    """
+    Block until a submitted coroutine finishes (at most AGENT_COROUTINE_TIMEOUT seconds)
+
+    Raises:
+        TimeoutError: the coroutine did not finish in time (it is cancelled)
+    """
+    if timeout is None:
+        timeout = config.AGENT_COROUTINE_TIMEOUT
+    if _GeventEvent is not None and is_module_patched("socket"):
+        # future.result() would block the hub, and every other request with it
+        done = _GeventEvent()
+        future.add_done_callback(lambda _: done.set())
+        done.wait(timeout)
+    else:
+        wait((future,), timeout)
+    if not future.done():
+        future.cancel()
+        raise TimeoutError(f"Agent coroutine did not finish within {timeout}s")
+    return future.result()
+
+
+def run_coro(agent_id: str, coro: Coroutine[Any, Any, T]) -> T:
+    """Run an agent's coroutine on its pinned loop and block until it finishes"""
+    return wait_future(submit_coro(agent_id, coro))
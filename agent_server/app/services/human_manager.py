@@ -5,45 +5,30 @@ Human Manager - Human Agent Management
 Responsible for creating, querying, deleting, and executing commands for Human Agents.
 """
 
-import sys
-import os
-
-# Add project root directory
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
 from threading import Lock
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from app.agent.human import HumanAgent
 from app.logger import logger
 
-import asyncio
-
 from ..config import config
 from ..models.agent import HumanInfo
+from .event_loop import run_coro
 
 
 class HumanManager:
-    """Human Agent Manager - Singleton"""
-
-    _instance = None
-    _lock = Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    """Human Agent Manager (use the module-level `human_manager` instance)"""
 
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-
         self._humans: Dict[str, HumanAgent] = {}
-        self._human_machines: Dict[str, List[str]] = {}  # human_id -> [machine_id, ...]
+        # human_id -> {machine_id: None, ...}; an insertion-ordered set (O(1) add/remove/contains)
+        self._human_machines: Dict[str, Dict[str, None]] = {}
+        # human_id -> (machine_ids snapshot, built info dict); reused while the set is unchanged
+        self._info_cache: Dict[str, Tuple[Tuple[str, ...], dict]] = {}
+        # IDs being created or deleted outside the lock (initialize / cleanup);
+        # reserved so the same ID cannot be created twice in the meantime
+        self._pending: Set[str] = set()
         self._data_lock = Lock()
-        self._initialized = True
 
     def create(self, human_id: str, machine_count: int = 3) -> Tuple[bool, str]:
         """
@@ -56,98 +41,122 @@ class HumanManager:
         Returns:
             (success, error_message)
         """
+        # Reserve the ID under the lock; initialize (MCP setup) runs without it
         with self._data_lock:
-            if human_id in self._humans:
+            if human_id in self._humans or human_id in self._pending:
                 return False, f"Human {human_id} already exists"
+            self._pending.add(human_id)
 
-            try:
-                human = HumanAgent(
-                    human_id=human_id,
-                    machine_count=machine_count
-                )
+        try:
+            human = HumanAgent(
+                human_id=human_id,
+                machine_count=machine_count
+            )
 
-                asyncio.run(human.initialize(
-                    connection_type="http_api",
-                    server_url=config.MCP_SERVER_URL
-                ))
+            run_coro(human_id, human.initialize(
+                connection_type="http_api",
+                server_url=config.MCP_SERVER_URL
+            ))
 
-                self._humans[human_id] = human
-                self._human_machines[human_id] = []
+        except Exception as e:
+            logger.error(f"Failed to create Human: {e}")
+            with self._data_lock:
+                self._pending.discard(human_id)
+            return False, str(e)
+
+        with self._data_lock:
+            self._pending.discard(human_id)
+            self._humans[human_id] = human
+            self._human_machines[human_id] = {}
 
-                logger.info(f"Human {human_id} created successfully")
-                return True, ""
+        logger.info(f"Human {human_id} created successfully")
+        return True, ""
 
-            except Exception as e:
-                logger.error(f"Failed to create Human: {e}")
-                return False, str(e)
+    # Read paths below take no lock: single dict/list operations are atomic
+    # under the GIL, and writers only ever replace or mutate one entry at a time.
 
     def get(self, human_id: str) -> Optional[HumanAgent]:
         """Get a Human Agent instance"""
-        with self._data_lock:
-            return self._humans.get(human_id)
+        return self._humans.get(human_id)
 
     def get_info(self, human_id: str) -> Optional[dict]:
         """Get Human information"""
-        with self._data_lock:
-            if human_id not in self._humans:
-                return None
-
-            return HumanInfo(
-                agent_id=human_id,
-                agent_type="human",
-                machine_ids=self._human_machines.get(human_id, [])
-            ).to_dict()
+        if human_id not in self._humans:
+            return None
+        return self._build_info(human_id)
 
     def get_all(self) -> Dict[str, dict]:
         """Get all Human information"""
-        with self._data_lock:
-            result = {}
-            # Build info directly to avoid deadlock from calling get_info()
-            for human_id in self._humans:
-                result[human_id] = HumanInfo(
-                    agent_id=human_id,
-                    agent_type="human",
-                    machine_ids=self._human_machines.get(human_id, [])
-                ).to_dict()
-            return result
+        return {human_id: self._build_info(human_id) for human_id in list(self._humans)}
+
+    def _build_info(self, human_id: str) -> dict:
+        """Return the Human's info dict, rebuilt only when its machine set changed"""
+        key = tuple(self._human_machines.get(human_id, ()))
+        cached = self._info_cache.get(human_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        info = HumanInfo(
+            agent_id=human_id,
+            agent_type="human",
+            machine_ids=list(key)
+        ).to_dict()
+        self._info_cache[human_id] = (key, info)
+        return info
+
+    def get_ids(self) -> List[str]:
+        """Get all Human IDs"""
+        return list(self._humans)
 
     def exists(self, human_id: str) -> bool:
         """Check if a Human exists"""
-        with self._data_lock:
-            return human_id in self._humans
+        return human_id in self._humans
 
     def delete(self, human_id: str) -> Tuple[bool, str]:
         """Delete a Human Agent"""
+        # Detach under the lock (keeping the ID reserved), then run the (slow)
+        # cleanup without holding it
         with self._data_lock:
-            if human_id not in self._humans:
+            human = self._humans.pop(human_id, None)
+            if human is None:
                 return False, f"Human {human_id} not found"
+            machine_ids = self._human_machines.pop(human_id, {})
+            self._info_cache.pop(human_id, None)
+            self._pending.add(human_id)
 
-            try:
-                human = self._humans[human_id]
-                asyncio.run(human.cleanup())
-
-                del self._humans[human_id]
-
-                # Return the list of associated machines for external handling
-                machine_ids = self._human_machines.pop(human_id, [])
+        try:
+            run_coro(human_id, human.cleanup())
 
-                logger.info(f"Human {human_id} deleted")
-                return True, ""
+        except Exception as e:
+            logger.error(f"Failed to delete Human: {e}")
+            # Put the Human back so the delete can be retried
+            with self._data_lock:
+                self._pending.discard(human_id)
+                self._humans[human_id] = human
+                self._human_machines[human_id] = machine_ids
+            return False, str(e)
 
-            except Exception as e:
-                logger.error(f"Failed to delete Human: {e}")
-                return False, str(e)
+        with self._data_lock:
+            self._pending.discard(human_id)
+        logger.info(f"Human {human_id} deleted")
+        return True, ""
 
     def send_command(self, human_id: str, command: str) -> Tuple[bool, str]:
-        """Send a command to a Human"""
-        # Get reference under lock, then release before running
-        with self._data_lock:
-            if human_id not in self._humans:
-                return False, f"Human {human_id} not found"
-            human = self._humans[human_id]
+        """Send a command to a Human (blocks until it finishes)"""
+        try:
+            return run_coro(human_id, self.send_command_async(human_id, command))
+        except Exception as e:
+            # The Human's event loop has stopped, or the command timed out
+            return False, str(e)
+
+    async def send_command_async(self, human_id: str, command: str) -> Tuple[bool, str]:
+        """Send a command to a Human; must run on the Human's pinned event loop"""
+        human = self._humans.get(human_id)
+        if human is None:
+            return False, f"Human {human_id} not found"
 
         try:
-            result = asyncio.run(human.run(command))
+            result = await human.run(command)
             return True, result
         except Exception as e:
             return False, str(e)
@@ -155,21 +164,37 @@ class HumanManager:
     def add_machine(self, human_id: str, machine_id: str):
         """Add a machine to the Human's management list"""
         with self._data_lock:
-            if human_id in self._human_machines:
-                if machine_id not in self._human_machines[human_id]:
-                    self._human_machines[human_id].append(machine_id)
+            machines = self._human_machines.get(human_id)
+            if machines is not None:
+                machines[machine_id] = None
+
+    def add_machines(self, human_id: str, machine_ids: List[str]):
+        """Add several machines to the Human's management list under one lock"""
+        with self._data_lock:
+            machines = self._human_machines.get(human_id)
+            if machines is None:
+                return
+            machines.update(dict.fromkeys(machine_ids))
 
     def remove_machine(self, human_id: str, machine_id: str):
         """Remove a machine from the Human's management list"""
         with self._data_lock:
-            if human_id in self._human_machines:
-                if machine_id in self._human_machines[human_id]:
-                    self._human_machines[human_id].remove(machine_id)
+            machines = self._human_machines.get(human_id)
+            if machines is not None:
+                machines.pop(machine_id, None)
+
+    def detach_machines(self, human_id: str) -> Iterable[str]:
+        """Take over a Human's machine set (no copy), leaving it empty"""
+        with self._data_lock:
+            if human_id not in self._human_machines:
+                return ()
+            machine_ids = self._human_machines[human_id]
+            self._human_machines[human_id] = {}
+            return machine_ids
 
     def get_machines(self, human_id: str) -> List[str]:
         """Get the list of machines managed by a Human"""
-        with self._data_lock:
-            return self._human_machines.get(human_id, []).copy()
+        return list(self._human_machines.get(human_id, ()))
 
 
 # Global instance
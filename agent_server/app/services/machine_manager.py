@@ -5,47 +5,35 @@ Machine Manager - Machine Agent 管理
 负责 Machine Agent 的创建、查询、删除和命令执行
 """
 
-import sys
-import os
-
-# 添加项目根目录
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
+import time
+from concurrent.futures import Future
 from threading import Lock
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from app.agent.machine import MachineAgent
 from app.agent.world_manager import Position
 from app.service.world_client import world_client
-from app.service.position_utils import find_random_valid_position
+from app.service.position_utils import find_random_valid_position, find_valid_positions
 from app.logger import logger
 
-import asyncio
-
 from ..config import config
 from ..models.agent import MachineInfo
+from .event_loop import run_coro, submit_coro, wait_future
 
 
 class MachineManager:
-    """Machine Agent 管理器 - 单例"""
-
-    _instance = None
-    _lock = Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    """Machine Agent 管理器（使用模块级实例 machine_manager）"""
 
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-
         self._machines: Dict[str, MachineAgent] = {}
         self._data_lock = Lock()
-        self._initialized = True
+        # 已预留、正在锁外注册或初始化的 Machine ID（防止同 ID 并发创建）
+        self._creating: Set[str] = set()
+        # World Server 全量机器数据快照 (monotonic 时间戳, 数据)
+        self._snapshot: Optional[Tuple[float, Dict[str, dict]]] = None
+        # 正在进行的快照刷新（同一时刻只有一个请求去拉取）
+        self._snapshot_refresh: Optional[Future] = None
+        self._snapshot_lock = Lock()
 
     def create(
         self,
@@ -65,92 +53,235 @@ class MachineManager:
             (success, error_message)
         """
         with self._data_lock:
-            if machine_id in self._machines:
+            if machine_id in self._machines or machine_id in self._creating:
                 return False, f"Machine {machine_id} already exists"
+            self._creating.add(machine_id)
 
-            try:
-                # 自动寻找位置
-                if position is None:
-                    position = find_random_valid_position()
-                    if not position:
-                        return False, "Cannot find valid position"
-
-                # 注册到 World Server
-                success, error = world_client.register_machine(
-                    machine_id=machine_id,
-                    position=position,
-                    owner=owner_id,
-                    life_value=10,
-                    machine_type="worker"
-                )
-
-                if not success:
-                    return False, error
-
-                # 创建 Machine Agent
-                machine = MachineAgent(
-                    machine_id=machine_id,
-                    location=Position(*position),
-                    life_value=10
-                )
-
-                asyncio.run(machine.initialize(
-                    connection_type="http_api",
-                    server_url=config.MCP_SERVER_URL
-                ))
-
-                self._machines[machine_id] = machine
-
-                logger.info(f"✅ Machine {machine_id} 创建成功")
-                return True, ""
+        # 锁外注册并等待 initialize，其他读写不必排在它后面
+        machine, error = self._register(machine_id, owner_id, position)
+        if machine is None:
+            self._release([machine_id])
+            return False, error
+        return self._finish_create(machine_id, machine, self._submit_initialize(machine))
+
+    def create_batch(
+        self,
+        machine_ids: List[str],
+        owner_id: str
+    ) -> List[Tuple[str, bool, str]]:
+        """
+        批量创建 Machine Agent
+
+        位置用 find_valid_positions 一次选出（互不重叠，只请求一次 World
+        Server），注册也通过 World Server 批量接口一次完成；各 Agent 的
+        initialize 则同时提交到各自的事件循环并发执行，总耗时约为一次
+        初始化而不是 N 次。
 
+        Args:
+            machine_ids: 机器人 ID 列表
+            owner_id: 所属 Human ID
+
+        Returns:
+            [(machine_id, success, error_message), ...]
+        """
+        results: Dict[str, Tuple[bool, str]] = {}
+        reserved = []
+        # 锁内只预留 ID；选位置、注册和初始化都在锁外进行
+        with self._data_lock:
+            for machine_id in machine_ids:
+                if machine_id in self._machines or machine_id in self._creating:
+                    results[machine_id] = (False, f"Machine {machine_id} already exists")
+                else:
+                    self._creating.add(machine_id)
+                    reserved.append(machine_id)
+
+        try:
+            positions = find_valid_positions(len(reserved)) if reserved else []
+        except Exception as e:
+            logger.error(f"选取 Machine 位置失败: {e}")
+            positions = []
+
+        specs = []
+        for i, machine_id in enumerate(reserved):
+            if i >= len(positions):
+                results[machine_id] = (False, "Cannot find valid position")
+            else:
+                specs.append({
+                    "machine_id": machine_id,
+                    "position": positions[i],
+                    "owner": owner_id,
+                    "life_value": 10,
+                    "machine_type": "worker",
+                })
+
+        registered = []
+        if specs:
+            try:
+                registered = world_client.register_machines(specs)
+            except Exception as e:
+                logger.error(f"批量注册 Machine 失败: {e}")
+                registered = [(False, str(e))] * len(specs)
+
+        pending = []
+        for spec, (success, error) in zip(specs, registered):
+            machine_id = spec["machine_id"]
+            if not success:
+                results[machine_id] = (False, error)
+                continue
+            try:
+                pending.append((machine_id, self._new_agent(machine_id, spec["position"])))
             except Exception as e:
                 logger.error(f"创建 Machine 失败: {e}")
-                return False, str(e)
+                results[machine_id] = (False, str(e))
+                self._unregister(machine_id)
+        # 没有进入初始化的 ID 释放预留
+        self._release([machine_id for machine_id in reserved if machine_id in results])
+
+        # initialize 同时提交，再逐个等待
+        pending = [(machine_id, machine, self._submit_initialize(machine)) for machine_id, machine in pending]
+        for machine_id, machine, future in pending:
+            results[machine_id] = self._finish_create(machine_id, machine, future)
+
+        return [(machine_id, *results[machine_id]) for machine_id in machine_ids]
+
+    def _register(
+        self,
+        machine_id: str,
+        owner_id: str,
+        position: Optional[List[float]]
+    ) -> Tuple[Optional[MachineAgent], str]:
+        """注册到 World Server，返回尚未初始化的 MachineAgent（调用方需已预留 machine_id）"""
+        try:
+            # 自动寻找位置
+            if position is None:
+                position = find_random_valid_position()
+                if not position:
+                    return None, "Cannot find valid position"
+
+            # 注册到 World Server
+            success, error = world_client.register_machine(
+                machine_id=machine_id,
+                position=position,
+                owner=owner_id,
+                life_value=10,
+                machine_type="worker"
+            )
+
+            if not success:
+                return None, error
+
+        except Exception as e:
+            logger.error(f"创建 Machine 失败: {e}")
+            return None, str(e)
+
+        try:
+            return self._new_agent(machine_id, position), ""
+        except Exception as e:
+            logger.error(f"创建 Machine 失败: {e}")
+            self._unregister(machine_id)
+            return None, str(e)
+
+    def _unregister(self, machine_id: str):
+        """回滚：从 World Server 移除已注册但未能创建成功的 Machine"""
+        try:
+            world_client.remove_machine(machine_id)
+            self._invalidate_snapshot()
+        except Exception as e:
+            logger.error(f"回滚 Machine {machine_id} 注册失败: {e}")
+
+    def _release(self, machine_ids: List[str]):
+        """释放未能创建成功的 Machine ID 预留"""
+        with self._data_lock:
+            self._creating.difference_update(machine_ids)
+
+    @staticmethod
+    def _new_agent(machine_id: str, position: List[float]) -> MachineAgent:
+        """创建（尚未初始化的）Machine Agent"""
+        return MachineAgent(
+            machine_id=machine_id,
+            location=Position(*position),
+            life_value=10
+        )
+
+    @staticmethod
+    def _initialize(machine: MachineAgent):
+        """Machine Agent 的初始化协程"""
+        return machine.initialize(
+            connection_type="http_api",
+            server_url=config.MCP_SERVER_URL
+        )
+
+    def _submit_initialize(self, machine: MachineAgent) -> Future:
+        """提交 initialize；事件循环已停止时返回带异常的 Future，由 _finish_create 统一处理"""
+        try:
+            return submit_coro(machine.machine_id, self._initialize(machine))
+        except RuntimeError as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+
+    def _finish_create(self, machine_id: str, machine: MachineAgent, future: Future) -> Tuple[bool, str]:
+        """等待 initialize 完成（不持有 _data_lock），再登记 Machine"""
+        try:
+            wait_future(future)
+        except Exception as e:
+            logger.error(f"创建 Machine 失败: {e}")
+            self._unregister(machine_id)
+            self._release([machine_id])
+            return False, str(e)
+
+        with self._data_lock:
+            self._creating.discard(machine_id)
+            self._machines[machine_id] = machine
+        self._invalidate_snapshot()
+
+        logger.info(f"✅ Machine {machine_id} 创建成功")
+        return True, ""
+
+    # 只读操作不加锁：单次 dict 操作在 GIL 下是原子的
 
     def get(self, machine_id: str) -> Optional[MachineAgent]:
         """获取 Machine Agent 实例"""
-        with self._data_lock:
-            return self._machines.get(machine_id)
+        return self._machines.get(machine_id)
 
     def get_info(self, machine_id: str) -> Optional[dict]:
         """获取 Machine 信息"""
-        with self._data_lock:
-            if machine_id not in self._machines:
-                return None
+        if machine_id not in self._machines:
+            return None
 
-            # 从 World Server 获取最新状态
-            machine_info = world_client.get_machine(machine_id)
-            if not machine_info:
-                return None
+        # 从 World Server 快照获取状态（不持有 _data_lock）
+        machine_info = self._get_snapshot().get(machine_id)
+        if not machine_info:
+            return None
 
-            return MachineInfo(
-                agent_id=machine_id,
-                owner_id=machine_info.get('owner', ''),
-                position=machine_info.get('position', [0, 0, 0]),
-                life_value=machine_info.get('life_value', 10)
-            ).to_dict()
+        return MachineInfo(
+            agent_id=machine_id,
+            owner_id=machine_info.get('owner', ''),
+            position=machine_info.get('position', [0, 0, 0]),
+            life_value=machine_info.get('life_value', 10)
+        ).to_dict()
 
     def get_all(self) -> Dict[str, dict]:
         """获取所有 Machine 信息"""
-        # 先获取机器ID列表（快速操作，持有锁时间短）
-        with self._data_lock:
-            machine_ids = list(self._machines.keys())
+        # tuple() 在 GIL 下一次性拍下 ID 快照，比构建 list 更省
+        return self.get_many(tuple(self._machines))
+
+    def get_ids(self) -> List[str]:
+        """获取所有 Machine ID"""
+        return list(self._machines)
 
+    def get_many(self, machine_ids: Sequence[str]) -> Dict[str, dict]:
+        """批量获取指定 Machine 的信息（一次 World Server 请求）"""
         if not machine_ids:
             return {}
 
         # 在锁外进行网络请求，避免长时间持有锁
         result = {}
         try:
-            # 优化：只调用一次 get_all_machines，避免重复请求
+            # 优化：共用一份 get_all_machines 快照，避免重复请求
             logger.info(f"🌐 批量获取 {len(machine_ids)} 个机器的信息")
-            all_machines = world_client.get_all_machines()
-            logger.info(f"✅ 从 World Server 获取到 {len(all_machines) if isinstance(all_machines, dict) else 0} 个机器数据")
-
-            if not isinstance(all_machines, dict):
-                logger.warning(f"⚠️ get_all_machines 返回了非字典类型: {type(all_machines)}")
-                all_machines = {}
+            all_machines = self._get_snapshot()
+            logger.info(f"✅ 从 World Server 获取到 {len(all_machines)} 个机器数据")
 
             for machine_id in machine_ids:
                 machine_info = all_machines.get(machine_id)
@@ -164,53 +295,114 @@ class MachineManager:
                 else:
                     logger.warning(f"⚠️ 机器 {machine_id} 在 World Server 中未找到")
         except Exception as e:
+            # 不再逐个重试：get_info 读的是同一份快照、同一个 World Server 接口，
+            # 批量失败时逐个获取只会串行地再失败 N 次（每次都可能等满超时）
             logger.error(f"❌ 批量获取所有 Machine 信息失败: {e}", exc_info=True)
-            # 降级：如果批量获取失败，回退到逐个获取
-            logger.info("🔄 降级到逐个获取机器信息")
-            for machine_id in machine_ids:
-                try:
-                    info = self.get_info(machine_id)
-                    if info:
-                        result[machine_id] = info
-                except Exception as e2:
-                    logger.error(f"获取机器 {machine_id} 信息失败: {e2}")
         return result
 
+    def _get_snapshot(self) -> Dict[str, dict]:
+        """
+        获取 World Server 全量机器数据（MACHINE_SNAPSHOT_TTL 秒内复用同一份）
+
+        过期时只有一个请求去刷新；_snapshot_lock 只保护检查和替换，不跨网络
+        请求持有。刷新期间其他请求直接用旧快照，没有旧快照时等待这次刷新。
+        """
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and time.monotonic() - snapshot[0] <= config.MACHINE_SNAPSHOT_TTL:
+                return snapshot[1]
+            refresh = self._snapshot_refresh
+            if refresh is None:
+                refresh = self._snapshot_refresh = Future()
+                # RUNNING 状态的 Future 不会被等待方超时取消
+                refresh.set_running_or_notify_cancel()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            if snapshot is not None:
+                return snapshot[1]
+            return wait_future(refresh)
+
+        try:
+            machines = world_client.get_all_machines()
+            if not isinstance(machines, dict):
+                logger.warning(f"⚠️ get_all_machines 返回了非字典类型: {type(machines)}")
+                machines = {}
+        except Exception as e:
+            with self._snapshot_lock:
+                self._snapshot_refresh = None
+            refresh.set_exception(e)
+            raise
+
+        with self._snapshot_lock:
+            self._snapshot = (time.monotonic(), machines)
+            self._snapshot_refresh = None
+        refresh.set_result(machines)
+        return machines
+
+    def _invalidate_snapshot(self):
+        """本地发起的变更后丢弃快照，保证随后的读取能看到变更"""
+        self._snapshot = None
+
     def exists(self, machine_id: str) -> bool:
         """检查 Machine 是否存在"""
-        with self._data_lock:
-            return machine_id in self._machines
+        return machine_id in self._machines
 
     def delete(self, machine_id: str) -> Tuple[bool, str]:
         """删除 Machine Agent"""
         with self._data_lock:
-            if machine_id not in self._machines:
-                return False, f"Machine {machine_id} not found"
-
-            try:
-                # 从 World Server 移除
-                world_client.remove_machine(machine_id)
+            machine = self._machines.pop(machine_id, None)
+        if machine is None:
+            return False, f"Machine {machine_id} not found"
 
-                # 删除本地实例
-                del self._machines[machine_id]
+        # 锁外调用 World Server，避免阻塞其他请求
+        return self._remove_detached(machine_id, machine)
 
-                logger.info(f"🧹 Machine {machine_id} 已删除")
-                return True, ""
+    def delete_batch(self, machine_ids: Iterable[str]) -> List[Tuple[str, bool, str]]:
+        """批量删除 Machine Agent（只获取一次锁，World Server 调用在锁外进行）"""
+        with self._data_lock:
+            detached = [(machine_id, self._machines.pop(machine_id, None)) for machine_id in machine_ids]
+
+        results = []
+        for machine_id, machine in detached:
+            if machine is None:
+                results.append((machine_id, False, f"Machine {machine_id} not found"))
+            else:
+                results.append((machine_id, *self._remove_detached(machine_id, machine)))
+        return results
+
+    def _remove_detached(self, machine_id: str, machine: MachineAgent) -> Tuple[bool, str]:
+        """从 World Server 移除已摘下的 Machine；失败时放回本地实例"""
+        try:
+            world_client.remove_machine(machine_id)
+            self._invalidate_snapshot()
+            logger.info(f"🧹 Machine {machine_id} 已删除")
+            return True, ""
 
-            except Exception as e:
-                logger.error(f"删除 Machine 失败: {e}")
-                return False, str(e)
+        except Exception as e:
+            logger.error(f"删除 Machine 失败: {e}")
+            with self._data_lock:
+                self._machines.setdefault(machine_id, machine)
+            return False, str(e)
 
     def send_command(self, machine_id: str, command: str) -> Tuple[bool, str]:
-        """Send command to Machine Agent"""
-        # Get machine reference under lock, then release before running
-        with self._data_lock:
-            if machine_id not in self._machines:
-                return False, f"Machine {machine_id} not found"
-            machine = self._machines[machine_id]
+        """Send command to Machine Agent (blocks until it finishes)"""
+        try:
+            return run_coro(machine_id, self.send_command_async(machine_id, command))
+        except Exception as e:
+            # 事件循环已停止或等待超时
+            return False, str(e)
+
+    async def send_command_async(self, machine_id: str, command: str) -> Tuple[bool, str]:
+        """Send command to Machine Agent; must run on the machine's pinned event loop"""
+        machine = self._machines.get(machine_id)
+        if machine is None:
+            return False, f"Machine {machine_id} not found"
 
         try:
-            result = asyncio.run(machine.run(command))
+            result = await machine.run(command)
             return True, result
         except Exception as e:
             return False, str(e)
@@ -220,7 +412,9 @@ class MachineManager:
         if machine_id not in self._machines:
             return False, f"Machine {machine_id} not found"
 
-        return world_client.update_machine_position(machine_id, position)
+        result = world_client.update_machine_position(machine_id, position)
+        self._invalidate_snapshot()
+        return result
 
     def update_life(self, machine_id: str, life_change: int) -> Tuple[bool, str]:
         """更新 Machine 生命值"""
@@ -228,6 +422,7 @@ class MachineManager:
             return False, f"Machine {machine_id} not found"
 
         success = world_client.update_machine_life(machine_id, life_change)
+        self._invalidate_snapshot()
         return success, "" if success else "Failed to update life"
 
 
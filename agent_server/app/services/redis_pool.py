@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Redis Pool - Shared Redis connection pool
+
+Every Agent Server service that talks to Redis builds its client on this
+pool, so the process keeps a single set of sockets to the server.
+Responses are raw bytes (decode_responses=False): task payloads go straight
+to orjson, and callers decode the few values they need as str.
+"""
+
+import redis
+
+from ..config import config
+
+
+redis_pool = redis.ConnectionPool(
+    host=config.REDIS_HOST,
+    port=config.REDIS_PORT,
+    db=config.REDIS_DB,
+    password=config.REDIS_PASSWORD,
+    max_connections=config.REDIS_MAX_CONNECTIONS,
+    decode_responses=False,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    socket_keepalive=True,  # keep idle pooled sockets alive through NAT/LB idle timeouts
+    health_check_interval=30,  # PING a connection idle this long before reusing it
+    retry_on_timeout=True
+)
+
+
+def get_redis_client() -> redis.Redis:
+    """Create a Redis client backed by the shared pool"""
+    return redis.Redis(connection_pool=redis_pool)
@@ -2,106 +2,159 @@
 """
 Task Service - Task Management Service
 
-Uses a thread pool to execute commands asynchronously within the main process,
+Executes commands as coroutines on the shared agent event loops within the main process,
 with results stored in Redis. This way worker threads share agent_service
 in-memory data with the Flask main process.
 """
 
-import json
+import asyncio
 import uuid
-import redis
-from concurrent.futures import ThreadPoolExecutor
-from threading import Lock
-from typing import Optional
+from typing import List, Optional, Tuple
+
+import orjson
 
 from ..config import config
 from app.logger import logger
 
+from .agent_service import agent_service
+from .event_loop import submit_coro
+from .redis_pool import get_redis_client
+
+# Initial status stored for every newly submitted task
+_PENDING_STATUS = orjson.dumps({
+    'status': 'PENDING',
+    'success': True,
+    'message': 'Task pending execution'
+})
+
+# Final status for a task replaced by a newer command before it ran
+_SUPERSEDED_STATUS = orjson.dumps({
+    'status': 'REVOKED',
+    'success': False,
+    'error': 'Task superseded by a newer command',
+    'cancelled': True
+})
+
 
 class TaskService:
     """
-    Task Management Service - Singleton
+    Task Management Service (use the module-level `task_service` instance)
 
-    Uses a thread pool instead of Celery to solve the problem of forked
-    processes being unable to share memory.
+    Runs commands in-process instead of via Celery to solve the problem of
+    forked processes being unable to share memory.
     """
 
-    _instance = None
-    _lock = Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-
-        self.redis_client = redis.Redis(
-            host=config.REDIS_HOST,
-            port=config.REDIS_PORT,
-            db=config.REDIS_DB,
-            password=config.REDIS_PASSWORD,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True
-        )
+        self.redis_client = get_redis_client()
         self.redis_client.ping()
         logger.info(f"Redis connected successfully: {config.REDIS_HOST}:{config.REDIS_PORT}")
 
-        self._key_prefix = config.REDIS_TASK_KEY_PREFIX
         self._task_ttl = config.REDIS_TASK_TTL
-        self._executor = ThreadPoolExecutor(max_workers=4)
-        self._initialized = True
 
-    def _task_key(self, agent_id: str) -> str:
-        return f"{self._key_prefix}{agent_id}"
+        # Key builders: the prefix's bound str.__add__, so each key is one concatenation
+        # _task_key(agent_id) -> "<REDIS_TASK_KEY_PREFIX><agent_id>"
+        # _result_key(task_id) -> "task_result:<task_id>"
+        self._task_key = config.REDIS_TASK_KEY_PREFIX.__add__
+        self._result_key = "task_result:".__add__
 
-    def _result_key(self, task_id: str) -> str:
-        return f"task_result:{task_id}"
+    def submit_command(self, agent_id: str, command: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Submit a command task to the agent's event loop (in-process, shared memory)
+
+        Returns:
+            (task_id, None) on success, (None, error_message) if the agent does not exist
+        """
+        if not agent_service.exists(agent_id):
+            return None, f"Agent {agent_id} not found"
 
-    def submit_command(self, agent_id: str, command: str) -> str:
-        """Submit a command task to the thread pool (in-process, shared memory)"""
         task_id = str(uuid.uuid4())
 
-        # Record the current agent's task_id
-        self.redis_client.setex(
-            self._task_key(agent_id), self._task_ttl, task_id
-        )
-
-        # Store initial status
-        self.redis_client.setex(
-            self._result_key(task_id),
-            self._task_ttl,
-            json.dumps({
-                'status': 'PENDING',
-                'success': True,
-                'message': 'Task pending execution'
-            }),
-        )
-
-        # Execute in thread pool
-        self._executor.submit(self._run_command, agent_id, command, task_id)
+        # Swap in the agent's new task_id (SET ... GET returns the one it replaces)
+        # and store the initial status, in one MULTI/EXEC
+        pipe = self.redis_client.pipeline()
+        pipe.set(self._task_key(agent_id), task_id, ex=self._task_ttl, get=True)
+        pipe.setex(self._result_key(task_id), self._task_ttl, _PENDING_STATUS)
+        previous, _ = pipe.execute()
+        if previous:
+            self._mark_superseded([previous])
 
-        logger.info(f"Task submitted: agent_id={agent_id}, task_id={task_id}")
-        return task_id
+        # Run as a coroutine on the agent's pinned loop
+        self._schedule(agent_id, command, task_id)
 
-    def _run_command(self, agent_id: str, command: str, task_id: str):
-        """Execute command in a thread"""
-        from .agent_service import agent_service
+        logger.info(f"Task submitted: agent_id={agent_id}, task_id={task_id}")
+        return task_id, None
+
+    def submit_commands(self, commands: List[Tuple[str, str]]) -> List[dict]:
+        """
+        Submit several command tasks at once
+
+        Task bookkeeping for every accepted command is written to Redis in a
+        single pipeline round-trip instead of two round-trips per command.
+
+        Args:
+            commands: [(agent_id, command), ...]
+
+        Returns:
+            One entry per input, in order:
+            {"agent_id": str, "task_id": str | None, "error": str | None}
+        """
+        results = []
+        accepted = []
+        pipe = self.redis_client.pipeline(transaction=False)
+
+        for agent_id, command in commands:
+            if not agent_service.exists(agent_id):
+                results.append({"agent_id": agent_id, "task_id": None, "error": f"Agent {agent_id} not found"})
+                continue
+
+            task_id = str(uuid.uuid4())
+            pipe.set(self._task_key(agent_id), task_id, ex=self._task_ttl, get=True)
+            pipe.setex(self._result_key(task_id), self._task_ttl, _PENDING_STATUS)
+            accepted.append((agent_id, command, task_id))
+            results.append({"agent_id": agent_id, "task_id": task_id, "error": None})
+
+        if accepted:
+            # Every other reply is the task_id its SET ... GET replaced
+            self._mark_superseded([old for old in pipe.execute()[::2] if old])
+
+        for agent_id, command, task_id in accepted:
+            self._schedule(agent_id, command, task_id)
+
+        logger.info(f"Batch submitted: {len(accepted)}/{len(commands)} task(s) accepted")
+        return results
+
+    def _mark_superseded(self, task_ids: List[bytes]):
+        """Give replaced tasks a final status so pollers stop seeing PENDING"""
+        if not task_ids:
+            return
+        pipe = self.redis_client.pipeline(transaction=False)
+        for old_task_id in task_ids:
+            pipe.setex(self._result_key(old_task_id.decode()), self._task_ttl, _SUPERSEDED_STATUS)
+        pipe.execute()
 
-        current = self.redis_client.get(self._task_key(agent_id))
-        if current != task_id:
+    def _schedule(self, agent_id: str, command: str, task_id: str):
+        """Start the command on the agent's loop; if that loop has stopped, fail the task now"""
+        try:
+            submit_coro(agent_id, self._run_command(agent_id, command, task_id))
+        except RuntimeError as e:
+            logger.error(f"Task not scheduled: agent_id={agent_id}, task_id={task_id}, error={e}")
+            self._store_result(agent_id, task_id, {'status': 'FAILURE', 'success': False, 'error': str(e)})
+
+    async def _run_command(self, agent_id: str, command: str, task_id: str):
+        """
+        Execute command on the agent's event loop
+
+        Redis calls block, so they run in a worker thread: the loop is shared
+        by every agent pinned to it.
+        """
+        current = await asyncio.to_thread(self.redis_client.get, self._task_key(agent_id))
+        if current is None or current.decode() != task_id:
             logger.warning(f"Task {task_id} has been superseded")
             return
 
         try:
             logger.info(f"Executing command: agent_id={agent_id}, task_id={task_id}")
-            success, result = agent_service.send_command(agent_id, command)
+            success, result = await agent_service.send_command_async(agent_id, command)
 
             if success:
                 logger.info(f"Command executed successfully: agent_id={agent_id}")
@@ -124,20 +177,25 @@ class TaskService:
             logger.error(f"Task execution exception: agent_id={agent_id}, error={e}")
             data = {'status': 'FAILURE', 'success': False, 'error': str(e)}
 
-        self.redis_client.setex(
-            self._result_key(task_id), self._task_ttl, json.dumps(data)
-        )
-        self.redis_client.delete(self._task_key(agent_id))
+        await asyncio.to_thread(self._store_result, agent_id, task_id, data)
+
+    def _store_result(self, agent_id: str, task_id: str, data: dict):
+        """Store the result and release the agent's task slot in one MULTI/EXEC"""
+        pipe = self.redis_client.pipeline()
+        pipe.setex(self._result_key(task_id), self._task_ttl, orjson.dumps(data))
+        pipe.delete(self._task_key(agent_id))
+        pipe.execute()
 
     def get_task_status(self, task_id: str) -> dict:
         """Get task status"""
         raw = self.redis_client.get(self._result_key(task_id))
         if not raw:
             return {'success': False, 'status': 'UNKNOWN', 'error': 'Task does not exist'}
-        return json.loads(raw)
+        return orjson.loads(raw)
 
     def get_agent_task_id(self, agent_id: str) -> Optional[str]:
-        return self.redis_client.get(self._task_key(agent_id))
+        raw = self.redis_client.get(self._task_key(agent_id))
+        return raw.decode() if raw is not None else None
 
     def clear_agent_task(self, agent_id: str):
         self.redis_client.delete(self._task_key(agent_id))
@@ -32,8 +32,13 @@ celery_app.conf.update(
     accept_content=['json'],
     timezone='UTC',
     enable_utc=True,
-    task_acks_late=True,  # 任务完成后才确认，允许取消
-    worker_prefetch_multiplier=1,  # 每次只预取一个任务
+    task_acks_late=config.CELERY_TASK_ACKS_LATE,  # 任务完成后才确认，允许取消
+    task_reject_on_worker_lost=config.CELERY_TASK_REJECT_ON_WORKER_LOST,  # worker 异常退出时重新入队
+    worker_prefetch_multiplier=config.CELERY_WORKER_PREFETCH_MULTIPLIER,  # 每次只预取一个任务
+    worker_disable_rate_limits=config.CELERY_WORKER_DISABLE_RATE_LIMITS,
+    worker_send_task_events=False,  # 不发送任务事件，减少 broker 流量
+    broker_heartbeat=0,  # 关闭 AMQP 心跳
+    broker_pool_limit=config.CELERY_BROKER_POOL_LIMIT,  # 与高并发 worker 池匹配的 broker 连接池
 )
 
 
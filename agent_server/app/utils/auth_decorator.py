@@ -1,50 +1,60 @@
 # -*- coding: utf-8 -*-
 """Authentication decorator — protects endpoints requiring a valid API key."""
 
-import sys
-import os
 from functools import wraps
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from flask import Response, request
 
-from flask import request
-
-from shared.response import error_response
+from app.logger import logger
+from shared.response import static_error_body
 from shared import error_codes as EC
 from agent_server.app.services.auth_service import auth_service
 
+# 401 bodies never vary, so they are serialized once at import
+_MISSING_BODY = static_error_body(EC.API_KEY_MISSING, "Authorization header is required")
+_PREFIX_BODY = static_error_body(
+    EC.BEARER_PREFIX_REQUIRED, "Authorization header must use 'Bearer <key>' format"
+)
+_INVALID_BODY = static_error_body(EC.API_KEY_INVALID, "Invalid API key")
+
+
+def _unauthorized(body):
+    return Response(body, status=401, mimetype="application/json")
+
+
+def _header_token():
+    """Token after the scheme in the raw Authorization header."""
+    return request.headers.get("Authorization", "").strip().partition(" ")[2].strip()
+
 
 def require_api_key(f):
     """Decorator: require a valid Bearer API key in the Authorization header."""
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from app.logger import logger
-
-        logger.info(f"API key auth: {request.method} {request.path}")
-
-        auth_header = request.headers.get("Authorization")
+        # Werkzeug parses the header: the scheme comes back lower-cased and the
+        # token stripped, so "bearer <key>" and stray whitespace are accepted
+        auth = request.authorization
 
-        if not auth_header:
+        if auth is None:
             logger.warning("API key missing")
-            return error_response(EC.API_KEY_MISSING, "Authorization header is required", 401)
+            return _unauthorized(_MISSING_BODY)
 
-        if not auth_header.startswith("Bearer "):
-            logger.warning("Bearer prefix missing")
-            return error_response(
-                EC.BEARER_PREFIX_REQUIRED,
-                "Authorization header must use 'Bearer <key>' format",
-                401,
-            )
+        api_key = auth.token
+        if api_key is None and auth.type == "bearer":
+            # Werkzeug 3.1 reads a token with "=" inside (e.g. "a=b") as
+            # auth-params and leaves .token None; take it from the header
+            api_key = _header_token()
 
-        api_key = auth_header[7:]
+        if auth.type != "bearer" or not api_key:
+            logger.warning("Bearer prefix missing")
+            return _unauthorized(_PREFIX_BODY)
 
         is_valid, user_id = auth_service.verify_api_key(api_key)
         if not is_valid:
             logger.warning("API key invalid")
-            return error_response(EC.API_KEY_INVALID, "Invalid API key", 401)
+            return _unauthorized(_INVALID_BODY)
 
-        logger.info(f"API key verified: user_id={user_id}")
         kwargs["user_id"] = user_id
         return f(*args, **kwargs)
 
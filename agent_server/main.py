@@ -4,7 +4,8 @@
 Agent Server — agent lifecycle, command execution, and auth.
 
 Usage:
-    python main.py          # Start Flask API server
+    python main.py          # Start API server (gevent WSGI, or AGENT_SERVER_POOL=threaded)
+    python main.py --dev    # Start API server on Flask's development server
     python main.py worker   # Start Celery Worker
 """
 
@@ -12,25 +13,68 @@ import sys
 import os
 import logging
 import argparse
+from typing import TYPE_CHECKING
 
-# Add paths
+# Add paths (the service directory, then the project root ahead of it)
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-sys.path.insert(0, os.path.dirname(current_dir))
-
-from flask import Flask
-from flask_cors import CORS
+for _path in (current_dir, os.path.dirname(current_dir)):
+    if _path in sys.path:
+        sys.path.remove(_path)
+    sys.path.insert(0, _path)
 
 from agent_server.app.config import config
-from agent_server.app.controllers.agent_controller import agent_bp
-from agent_server.app.controllers.auth_controller import auth_bp
-from agent_server.app.controllers.proxy_controller import proxy_bp
 
+_mode = sys.argv[1] if len(sys.argv) > 1 else "server"
+if _mode == "worker":
+    _pool = config.CELERY_WORKER_POOL
+else:
+    _pool = "threaded" if "--dev" in sys.argv else config.AGENT_SERVER_POOL
+if _pool == "gevent":
+    # Patch the stdlib before requests/redis are imported so their sockets cooperate.
+    # Threads and queues stay native: the agent event loops (services/event_loop.py)
+    # and asyncio.to_thread need real OS threads, and greenlet-patched queues
+    # cannot be used from them.
+    # threading.Lock therefore stays a native lock while requests are greenlets on
+    # one OS thread: a service lock must never be held across network I/O or
+    # run_coro/wait_future, or the next greenlet to take it blocks the hub for
+    # good. The service locks only guard in-memory bookkeeping; slow work
+    # (World Server calls, agent initialize/cleanup) runs with them released.
+    from gevent import monkey
+
+    monkey.patch_all(thread=False, queue=False)
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+
+def create_app() -> "Flask":
+    """Create the Flask application.
+
+    Flask and the controllers (which pull in the agent services) are imported
+    here rather than at module level, so ``main.py worker`` never loads them.
+    """
+    from flask import Flask
+    from flask_cors import CORS
+    from flask_compress import Compress
+
+    from shared.json_provider import ORJSONProvider
+    from agent_server.app.controllers.agent_controller import agent_bp
+    from agent_server.app.controllers.auth_controller import auth_bp
+    from agent_server.app.controllers.proxy_controller import proxy_bp
 
-def create_app() -> Flask:
-    """Create the Flask application."""
     flask_app = Flask(__name__)
+    flask_app.json = ORJSONProvider(flask_app)
+    # Must be set before blueprints bind their rules: "/agents/" then matches
+    # directly instead of costing the client a 308 redirect round-trip
+    flask_app.url_map.strict_slashes = False
     CORS(flask_app)
+    # World views and agent lists are large, repetitive JSON; small bodies
+    # (health, auth errors) stay below the threshold and go out as-is
+    flask_app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    flask_app.config["COMPRESS_BR_LEVEL"] = 4
+    flask_app.config["COMPRESS_LEVEL"] = 6
+    flask_app.config["COMPRESS_MIN_SIZE"] = 1024
+    Compress(flask_app)
     flask_app.register_blueprint(auth_bp)
     flask_app.register_blueprint(agent_bp)
     flask_app.register_blueprint(proxy_bp)
@@ -42,52 +86,85 @@ def create_app() -> Flask:
     return flask_app
 
 
-def run_server():
-    """Start the Flask API server."""
+def run_server(dev: bool = False):
+    """Start the API server.
+
+    Production runs on gevent's WSGI server in this one process: agents live
+    in process memory, so extra pre-forked workers would each see a different
+    agent set. ``dev``, or AGENT_SERVER_POOL=threaded, falls back to Flask's
+    built-in server.
+    """
     log = logging.getLogger("werkzeug")
     log.setLevel(logging.ERROR)
 
     flask_app = create_app()
 
-    print("=" * 50)
-    print("Agent Server")
-    print("=" * 50)
-    print(f"Address: http://{config.HOST}:{config.PORT}")
-    print(f"MCP Server: {config.MCP_SERVER_URL}")
-    print(f"World Server: {config.WORLD_SERVER_URL}")
-    print("\nAPI:")
-    print("  Auth:")
-    print("    POST   /api/v1/auth/register         - Register, get API key")
-    print("    POST   /api/v1/auth/verify            - Verify API key")
-    print("  Agents:")
-    print("    POST   /api/v1/agents                 - Create agent (auth)")
-    print("    GET    /api/v1/agents                 - List agents (auth)")
-    print("    GET    /api/v1/agents/<id>            - Get agent info (auth)")
-    print("    PUT    /api/v1/agents/<id>            - Update agent (auth)")
-    print("    POST   /api/v1/agents/<id>/commands   - Send command (auth)")
-    print("    GET    /api/v1/agents/tasks/<id>      - Task status (auth)")
-    print("    DELETE /api/v1/agents/<id>            - Delete agent (auth)")
-    print("  World Proxy:")
-    print("    GET    /api/v1/world/view             - Fog-of-war view (auth)")
-    print("=" * 50)
-    print("\nNote: Start World Server and MCP Server first.")
-    print("Service started\n")
-
-    flask_app.run(host=config.HOST, port=config.PORT, debug=False, threaded=True)
+    # One write for the whole banner, so it is not interleaved with other output
+    print("\n".join([
+        "=" * 50,
+        "Agent Server",
+        "=" * 50,
+        f"Address: http://{config.HOST}:{config.PORT}",
+        f"MCP Server: {config.MCP_SERVER_URL}",
+        f"World Server: {config.WORLD_SERVER_URL}",
+        "\nAPI:",
+        "  Auth:",
+        "    POST   /api/v1/auth/register         - Register, get API key",
+        "    POST   /api/v1/auth/verify            - Verify API key",
+        "  Agents:",
+        "    POST   /api/v1/agents                 - Create agent (auth)",
+        "    GET    /api/v1/agents                 - List agents (auth)",
+        "    GET    /api/v1/agents/<id>            - Get agent info (auth)",
+        "    PUT    /api/v1/agents/<id>            - Update agent (auth)",
+        "    POST   /api/v1/agents/<id>/commands   - Send command (auth)",
+        "    POST   /api/v1/agents/commands/batch  - Send commands in bulk (auth)",
+        "    GET    /api/v1/agents/tasks/<id>      - Task status (auth)",
+        "    DELETE /api/v1/agents/<id>            - Delete agent (auth)",
+        "  World Proxy:",
+        "    GET    /api/v1/world/view             - Fog-of-war view (auth)",
+        "=" * 50,
+        "\nNote: Start World Server and MCP Server first.",
+        "Service started\n",
+    ]), flush=True)
+
+    if dev or config.AGENT_SERVER_POOL != "gevent":
+        flask_app.run(host=config.HOST, port=config.PORT, debug=False, threaded=True)
+        return
+
+    from gevent.pywsgi import WSGIServer
+
+    # One greenlet per request: a proxied World Server call waits on its
+    # socket without pinning an OS thread. The pool bounds in-flight requests
+    # so a burst queues in the listen backlog instead of exhausting memory.
+    WSGIServer(
+        (config.HOST, config.PORT),
+        flask_app,
+        spawn=config.AGENT_SERVER_MAX_CONNECTIONS,
+        backlog=config.AGENT_SERVER_BACKLOG,
+        log=None,
+    ).serve_forever()
 
 
 def run_worker():
     """Start the Celery Worker."""
     from agent_server.app.services.tasks import celery_app
 
-    print("=" * 50)
-    print("Celery Worker — async task processing")
-    print("=" * 50)
-    print(f"Broker: {config.CELERY_BROKER_URL}")
-    print(f"Backend: {config.CELERY_RESULT_BACKEND}")
-    print("Worker started\n")
+    print("\n".join([
+        "=" * 50,
+        "Celery Worker — async task processing",
+        "=" * 50,
+        f"Broker: {config.CELERY_BROKER_URL}",
+        f"Backend: {config.CELERY_RESULT_BACKEND}",
+        f"Pool: {config.CELERY_WORKER_POOL} (concurrency={config.CELERY_WORKER_CONCURRENCY})",
+        "Worker started\n",
+    ]), flush=True)
 
-    celery_app.worker_main(["worker", "--loglevel=info"])
+    celery_app.worker_main([
+        "worker",
+        "--loglevel=info",
+        f"--pool={config.CELERY_WORKER_POOL}",
+        f"--concurrency={config.CELERY_WORKER_CONCURRENCY}",
+    ])
 
 
 def main():
@@ -100,13 +177,18 @@ def main():
         choices=["server", "worker"],
         help="Run mode: server (default) or worker",
     )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Serve with Flask's development server instead of gevent",
+    )
 
     args = parser.parse_args()
 
     if args.mode == "worker":
         run_worker()
     else:
-        run_server()
+        run_server(dev=args.dev)
 
 
 if __name__ == "__main__":
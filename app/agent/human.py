@@ -2,8 +2,8 @@
 Human Agent — intelligent commander that decomposes tasks and coordinates machines.
 """
 
+import asyncio
 import os
-import uuid
 
 import requests
 from typing import Any, Dict, List, Optional, Tuple
@@ -12,6 +12,7 @@ from pydantic import Field, PrivateAttr
 
 from app.agent.mcp import MCPAgent
 from app.logger import logger
+from app.schema import Message
 from app.service.map_manager import map_manager
 from app.prompt.human import (
     SYSTEM_PROMPT,
@@ -21,6 +22,32 @@ from app.prompt.human import (
 WORLD_SERVER_URL = os.getenv("WORLD_SERVER_URL", "http://localhost:8005")
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8003")
 
+# Only tools with these prefixes are listed in the Human system prompt
+_HUMAN_TOOL_PREFIXES = ("human_", "mcp_python_human_")
+
+# ((name, description) pairs, rendered section) for the last tool_map seen.
+# Every Human connects to the same MCP server, so the section is rendered
+# once per catalog.
+_tool_section_cache: Tuple[Tuple[Tuple[str, Optional[str]], ...], str] = ((), "")
+
+
+def _render_tool_section(tool_map: Dict[str, Any]) -> str:
+    """Render the tool section of the system prompt, cached by tool names and descriptions."""
+    global _tool_section_cache
+    # Descriptions are part of the key: a re-listed tool may keep its name
+    key = tuple((name, getattr(tool, "description", None)) for name, tool in tool_map.items())
+    cached_key, section = _tool_section_cache
+    if key == cached_key:
+        return section
+    tools_text = "\n".join([
+        f"- {name}: {tool.description}"
+        for name, tool in tool_map.items()
+        if name.startswith(_HUMAN_TOOL_PREFIXES) and hasattr(tool, "description")
+    ])
+    section = f"\n\n🔧 当前可用工具:\n{tools_text}\n\nAvailable MCP tools: {', '.join(tool_map)}"
+    _tool_section_cache = (key, section)
+    return section
+
 
 class HumanAgent(MCPAgent):
     """
@@ -41,7 +68,7 @@ class HumanAgent(MCPAgent):
     parallel_tool_calls: bool = True
 
     # Human特有属性
-    human_id: str = Field(default_factory=lambda: f"commander_{uuid.uuid4().hex[:8]}")
+    human_id: str = Field(default_factory=lambda: f"commander_{os.urandom(4).hex()}")
     global_map: Dict[str, Any] = Field(default_factory=dict)
 
     _map_manager: Any = PrivateAttr(default_factory=lambda: map_manager)
@@ -103,29 +130,18 @@ class HumanAgent(MCPAgent):
         """Dynamically update system message with tool details."""
         if not self.mcp_clients or not self.mcp_clients.tool_map:
             return
-        # Generate tool list, only show Human Agent tools
-        tools_list = []
-        for tool_name, tool_info in self.mcp_clients.tool_map.items():
-            # Only show tools prefixed with human_
-            if tool_name.startswith('human_') or tool_name.startswith('mcp_python_human_'):
-                if hasattr(tool_info, 'description'):
-                    description = tool_info.description
-                    tools_list.append(f"- {tool_name}: {description}")
-        tools_text = "\n".join(tools_list)
         # Append tool details to the existing system prompt instead of replacing it
         if self.memory.messages and self.memory.messages[0].role == "system":
-            from app.schema import Message
-            tool_names = list(self.mcp_clients.tool_map.keys())
-            tools_info = ", ".join(tool_names)
+            tool_section = _render_tool_section(self.mcp_clients.tool_map)
             original_content = self.memory.messages[0].content
-            tool_section = f"\n\n🔧 当前可用工具:\n{tools_text}\n\nAvailable MCP tools: {tools_info}"
             self.memory.messages[0] = Message.system_message(original_content + tool_section)
 
     async def create_machine_at_position(self, machine_id: str, position: list) -> bool:
         """Create a single machine at the specified position."""
         try:
-            # 通过 HTTP API 注册机器人到 World Server
-            resp = requests.post(
+            # 通过 HTTP API 注册机器人到 World Server（放到线程里，并发创建时不阻塞事件循环）
+            resp = await asyncio.to_thread(
+                requests.post,
                 f"{WORLD_SERVER_URL}/api/v1/world/machines",
                 json={
                     "machine_id": machine_id,
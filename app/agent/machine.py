@@ -3,7 +3,6 @@ Machine Agent - 智能机器人，执行来自Human Agent的本地任务
 """
 
 import os
-import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field, PrivateAttr
@@ -11,7 +10,7 @@ from pydantic import Field, PrivateAttr
 from app.agent.mcp import MCPAgent
 from app.agent.world_manager import Position
 from app.logger import logger
-from app.schema import AgentState
+from app.schema import AgentState, Message
 from app.service.map_manager import map_manager
 from app.prompt.machine import (
     SYSTEM_PROMPT,
@@ -20,6 +19,31 @@ from app.prompt.machine import (
 
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8003")
 
+# 系统提示词中只列出 Machine 专用工具
+_MACHINE_TOOL_PREFIXES = ("machine_", "mcp_python_machine_")
+
+# 上一次渲染的 ((工具名, 描述) 列表, 工具列表文本)。所有 Machine 连接同一个 MCP 服务器，
+# 工具目录不变时只渲染一次
+_tools_text_cache: Tuple[Tuple[Tuple[str, Optional[str]], ...], str] = ((), "")
+
+
+def _render_tools_text(tool_map: Dict[str, Any]) -> str:
+    """生成 Machine 工具列表文本，按工具名和描述缓存"""
+    global _tools_text_cache
+    # 描述也计入缓存键：重新列出的工具可能同名但描述已变
+    key = tuple((name, getattr(tool, "description", None)) for name, tool in tool_map.items())
+    cached_key, tools_text = _tools_text_cache
+    if key == cached_key:
+        return tools_text
+    tools_text = "\n".join([
+        f"- {name}: {tool.description}"
+        for name, tool in tool_map.items()
+        # 兼容两种工具格式：字典和HTTPMCPTool对象
+        if name.startswith(_MACHINE_TOOL_PREFIXES) and hasattr(tool, "description")
+    ])
+    _tools_text_cache = (key, tools_text)
+    return tools_text
+
 
 class MachineAgent(MCPAgent):
     """
@@ -44,7 +68,7 @@ class MachineAgent(MCPAgent):
     agent_type: str = "machine"
 
     # 机器人特有属性
-    machine_id: str = Field(default_factory=lambda: f"machine_{uuid.uuid4().hex[:8]}")
+    machine_id: str = Field(default_factory=lambda: f"machine_{os.urandom(4).hex()}")
     location: Position = Field(default_factory=lambda: Position(0.0, 0.0, 0.0))
     life_value: int = Field(default=10)
     machine_type: str = Field(default="worker")
@@ -115,22 +139,12 @@ class MachineAgent(MCPAgent):
         """动态更新系统消息，添加工具信息"""
         if not self.mcp_clients or not self.mcp_clients.tool_map:
             return
-        # 生成工具列表，只显示Machine Agent专用工具
-        tools_list = []
-        for tool_name, tool_info in self.mcp_clients.tool_map.items():
-            # 只显示以machine_开头的工具
-            if tool_name.startswith('machine_') or tool_name.startswith('mcp_python_machine_'):
-                # 兼容两种工具格式：字典和HTTPMCPTool对象
-                if hasattr(tool_info, 'description'):
-                    description = tool_info.description
-                    tools_list.append(f"- {tool_name}: {description}")
-        tools_text = "\n".join(tools_list)
         # 更新系统消息
         if self.memory.messages and self.memory.messages[0].role == "system":
+            tools_text = _render_tools_text(self.mcp_clients.tool_map)
             content = self.memory.messages[0].content
             base_prompt = content.split("\n\nAvailable MCP tools:")[0]
             new_content = f"{base_prompt}\n\n🔧 当前可用工具:\n{tools_text}"
-            from app.schema import Message
             self.memory.messages[0] = Message.system_message(new_content)
 
     async def update_system_prompt(self) -> None:
@@ -143,30 +157,10 @@ class MachineAgent(MCPAgent):
             life_value=self.life_value
         )
 
-        from app.schema import Message
         self.memory.add_message(Message.system_message(formatted_prompt))
 
     # 删除remove_from_world方法 - 很少使用，由MCP服务器管理
 
-    async def think(self) -> bool:
-        """重写think方法以支持内部连接模式"""
-        if hasattr(self, '_internal_server'):
-            # 内部连接模式 - 跳过MCP连接检查，直接使用ToolCallAgent的think
-            from app.agent.toolcall import ToolCallAgent
-            return await ToolCallAgent.think(self)
-        else:
-            # 外部连接模式 - 使用父类方法
-            return await super().think()
-
-    async def cleanup(self, *args, **kwargs):
-        """清理机器人资源 - 内部连接模式不需要清理MCP连接"""
-        if hasattr(self, '_internal_server'):
-            # 内部连接模式，不需要断开连接
-            logger.info(f"Machine {self.machine_id} cleanup completed (internal mode)")
-        else:
-            # 外部连接模式，调用父类清理
-            await super().cleanup(*args, **kwargs)
-
     def _should_finish_execution(self, name: str, **kwargs) -> bool:
         """确定工具执行是否应该结束agent"""
         # 检查生命值是否过低
@@ -216,7 +210,6 @@ class MachineAgent(MCPAgent):
             await self.update_system_prompt()
 
             # 添加当前状态信息
-            from app.schema import Message
             self.memory.add_message(Message.system_message(
                 f"🎯 当前状态：位置 {self.location}, 生命值 {self.life_value}\n"
                 f"📊 执行历史：{len(self.command_history)} 个命令\n"
@@ -1,7 +1,9 @@
 import asyncio
 import json
+import re
 from typing import Any, List, Optional, Union
 
+import orjson
 from pydantic import Field
 
 from app.agent.react import ReActAgent
@@ -14,6 +16,9 @@ from app.tool import ToolCollection
 
 TOOL_CALL_REQUIRED = "Tool calls required but none provided"
 
+# Numeric part of a shorthand machine_id: "1", "01", "robot-1", "robot_1", ...
+_MACHINE_NUM_RE = re.compile(r"(\d+)")
+
 
 class ToolCallAgent(ReActAgent):
     """Base agent class for handling tool/function calls with enhanced abstraction"""
@@ -217,8 +222,8 @@ class ToolCallAgent(ReActAgent):
             return f"Error: Unknown tool '{name}'"
 
         try:
-            # Parse arguments
-            args = json.loads(command.function.arguments or "{}")
+            # Parse arguments (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            args = orjson.loads(command.function.arguments or "{}")
 
             # Auto-inject caller_id (only for Human Agent)
             if hasattr(self, 'human_id') and self.human_id:
@@ -234,9 +239,7 @@ class ToolCallAgent(ReActAgent):
                         machine_count = getattr(self, 'machine_count', 3)
                         # If already a full ID format, do not modify
                         if not mid.startswith(f"{human_id}_robot_"):
-                            import re
-                            # Extract numeric part: supports "1", "01", "robot-1", "robot_1", etc.
-                            num_match = re.search(r'(\d+)', mid)
+                            num_match = _MACHINE_NUM_RE.search(mid)
                             if num_match:
                                 num = int(num_match.group(1))
                                 # If the number is within valid range, map to full ID
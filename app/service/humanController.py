@@ -3,12 +3,13 @@
 Human 控制器 - 封装 Human 和 Machine 的创建和管理逻辑
 """
 
+import asyncio
 import os
 from typing import Tuple
 
 from app.agent.human import HumanAgent
 from app.logger import logger
-from app.service.position_utils import find_random_valid_position
+from app.service.position_utils import find_valid_positions
 
 
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8003")
@@ -44,20 +45,24 @@ class HumanController:
             server_url=mcp_server_url
         )
 
+        positions = find_valid_positions(machine_count)
+        machine_ids = [f"{human_id}_robot_{i+1:02d}" for i in range(machine_count)]
+        for machine_id in machine_ids[len(positions):]:
+            logger.warning(f"⚠️ 无法为机器人 {machine_id} 找到合法位置")
+
+        # 各机器人注册互不依赖，并发发出，总耗时约为一次往返而不是 N 次
+        results = await asyncio.gather(*(
+            human.create_machine_at_position(machine_id, position)
+            for machine_id, position in zip(machine_ids, positions)
+        ))
+
         created_count = 0
-        for i in range(machine_count):
-            machine_id = f"{human_id}_robot_{i+1:02d}"
-
-            position = find_random_valid_position()
-            if position:
-                success = await human.create_machine_at_position(machine_id, position)
-                if success:
-                    created_count += 1
-                    logger.info(f"✅ 机器人 {machine_id} 创建成功")
-                else:
-                    logger.warning(f"⚠️ 机器人 {machine_id} 创建失败")
+        for machine_id, success in zip(machine_ids, results):
+            if success:
+                created_count += 1
+                logger.info(f"✅ 机器人 {machine_id} 创建成功")
             else:
-                logger.warning(f"⚠️ 无法为机器人 {machine_id} 找到合法位置")
+                logger.warning(f"⚠️ 机器人 {machine_id} 创建失败")
 
         return human, created_count
 
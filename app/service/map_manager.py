@@ -59,6 +59,12 @@ class MapManager:
         self._queue: "Queue[MapObservation]" = Queue()
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        # Bumped on every map change; snapshots are rebuilt only when it moves
+        self._version = 0
+        self._global_snapshot: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Per-machine snapshots for the current _version only; cleared on every
+        # bump, so entries for stale versions (or departed machines) never pile up
+        self._machine_snapshots: Dict[str, Dict[str, Any]] = {}
 
         self._worker = threading.Thread(
             target=self._run_worker, name="MapManagerWorker", daemon=True
@@ -72,36 +78,54 @@ class MapManager:
             if machine_id not in self._machine_maps:
                 self._machine_maps[machine_id] = {}
             self._machine_positions[machine_id] = int_position
+            self._bump_version()
+
+    def _bump_version(self) -> None:
+        """Mark the maps as changed (caller holds _lock)."""
+        self._version += 1
+        self._machine_snapshots.clear()
 
     def submit_observation(self, observation: MapObservation) -> None:
         """Enqueue a new observation for background processing."""
         self._queue.put(observation)
 
     def get_machine_map_snapshot(self, machine_id: str) -> Dict[str, Any]:
-        """Return a serializable snapshot of a machine's known map."""
+        """Return a serializable snapshot of a machine's known map.
+
+        The snapshot is shared until the map changes; treat it as read-only.
+        """
         with self._lock:
-            cells = [
-                cell.to_dict()
-                for cell in self._machine_maps.get(machine_id, {}).values()
-            ]
-            position = self._machine_positions.get(machine_id)
-        return {
-            "machine_id": machine_id,
-            "known_cells": cells,
-            "last_position": position,
-            "generated_at": time.time(),
-        }
+            cached = self._machine_snapshots.get(machine_id)
+            if cached is not None:
+                return cached
+            snapshot = {
+                "machine_id": machine_id,
+                "known_cells": [
+                    cell.to_dict()
+                    for cell in self._machine_maps.get(machine_id, {}).values()
+                ],
+                "last_position": self._machine_positions.get(machine_id),
+                "generated_at": time.time(),
+            }
+            self._machine_snapshots[machine_id] = snapshot
+        return snapshot
 
     def get_global_map_snapshot(self) -> Dict[str, Any]:
-        """Return a serializable snapshot of the combined map."""
+        """Return a serializable snapshot of the combined map.
+
+        The snapshot is shared until the map changes; treat it as read-only.
+        """
         with self._lock:
-            cells = [cell.to_dict() for cell in self._global_map.values()]
-            machine_positions = dict(self._machine_positions)
-        return {
-            "known_cells": cells,
-            "machine_positions": machine_positions,
-            "generated_at": time.time(),
-        }
+            cached = self._global_snapshot
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+            snapshot = {
+                "known_cells": [cell.to_dict() for cell in self._global_map.values()],
+                "machine_positions": dict(self._machine_positions),
+                "generated_at": time.time(),
+            }
+            self._global_snapshot = (self._version, snapshot)
+        return snapshot
 
     def _run_worker(self) -> None:
         """Continuously process observation events."""
@@ -177,6 +201,7 @@ class MapManager:
                 current_cell = self._global_map.get(coordinate)
                 if not current_cell or cell.updated_at >= current_cell.updated_at:
                     self._global_map[coordinate] = cell
+            self._bump_version()
 
     def stop(self) -> None:
         """Signal the worker to stop. Primarily used in tests."""
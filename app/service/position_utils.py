@@ -3,38 +3,79 @@
 位置工具模块 - 提供位置查找和验证相关的工具函数
 """
 
+import math
 import random
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 
-from app.service.world_client import world_client
+from app.service.world_client import world_client, collides
 from app.logger import logger
 
 
-def find_random_valid_position(max_attempts: int = 50, map_range: int = 14) -> Optional[List[float]]:
+def _blocked_cells(occupants: List[Tuple[List[float], float]], size: float) -> Set[Tuple[int, int]]:
+    """z=0 平面上放置 size 大小物体会与任一占用物碰撞的整数格子"""
+    blocked = set()
+    for occ_pos, occ_size in occupants:
+        reach = max(size, occ_size) * 0.5
+        x0, y0 = occ_pos[0], occ_pos[1]
+        occupant = [(occ_pos, occ_size)]
+        for x in range(math.ceil(x0 - reach), math.floor(x0 + reach) + 1):
+            for y in range(math.ceil(y0 - reach), math.floor(y0 + reach) + 1):
+                if collides([float(x), float(y), 0.0], size, occupant):
+                    blocked.add((x, y))
+    return blocked
+
+
+def find_valid_positions(count: int, map_range: int = 14) -> List[List[float]]:
+    """
+    在地图范围内一次找出 count 个互不重叠的合法随机位置
+
+    候选点取自整数网格（间距 >= 1.0，彼此不会碰撞，无需去重）。先按
+    World Server 的机器/障碍物快照标出被占用的格子（每个占用物只检查
+    其覆盖范围内的几个格子），再从空闲格子中随机抽取；整个过程只请求
+    一次 World Server，而不是每个候选点请求一次。
+
+    Args:
+        count: 需要的位置数量
+        map_range: 地图范围（默认 14，表示 -13 到 13）
+
+    Returns:
+        合法位置列表 [[x, y, z], ...]，找不到足够位置时返回的数量少于 count
+    """
+    if count <= 0:
+        return []
+
+    try:
+        occupants = world_client.get_occupants()
+    except Exception as e:
+        logger.warning(f"获取世界占用信息失败: {e}")
+        return []
+
+    blocked = _blocked_cells(occupants, 1.0)
+    free = [
+        (x, y)
+        for x in range(-map_range + 1, map_range)
+        for y in range(-map_range + 1, map_range)
+        if (x, y) not in blocked
+    ]
+    positions = [[float(x), float(y), 0.0] for x, y in random.sample(free, min(count, len(free)))]
+
+    if len(positions) < count:
+        logger.error(f"只找到 {len(positions)}/{count} 个合法位置")
+    return positions
+
+
+def find_random_valid_position(map_range: int = 14) -> Optional[List[float]]:
     """
     在地图范围内找到一个合法的随机位置
 
     Args:
-        max_attempts: 最大尝试次数
         map_range: 地图范围（默认 14，表示 -13 到 13）
 
     Returns:
         合法位置的坐标列表 [x, y, z]，如果找不到则返回 None
     """
-    for _ in range(max_attempts):
-        x = random.randint(-map_range + 1, map_range - 1)
-        y = random.randint(-map_range + 1, map_range - 1)
-        position = [float(x), float(y), 0.0]
-
-        try:
-            result = world_client.check_collision(position, 1.0)
-            if not result.get('collision', True):
-                logger.info(f"找到合法位置: {position}")
-                return position
-        except Exception as e:
-            logger.warning(f"碰撞检测失败 {position}: {e}")
-            continue
-
-    logger.error(f"尝试了 {max_attempts} 次都无法找到合法位置")
-    return None
-
+    positions = find_valid_positions(1, map_range)
+    if not positions:
+        return None
+    logger.info(f"找到合法位置: {positions[0]}")
+    return positions[0]
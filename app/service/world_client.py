@@ -3,29 +3,45 @@
 
 import os
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
 
 
 WORLD_SERVER_URL = os.getenv("WORLD_SERVER_URL", "http://localhost:8005")
 
 
+def collides(position: List[float], size: float, occupants: List[Tuple[List[float], float]]) -> bool:
+    """Whether an object of ``size`` at ``position`` overlaps any (position, size) occupant."""
+    for occ_pos, occ_size in occupants:
+        dist = sum((a - b) ** 2 for a, b in zip(position, occ_pos)) ** 0.5
+        if dist < max(size, occ_size) * 0.5:
+            return True
+    return False
+
+
 class WorldClient:
     """HTTP client for the World Server."""
 
     def __init__(self, base_url: str = WORLD_SERVER_URL):
         self.base_url = base_url
         self.timeout = 5
+        # Keep-alive connection pool, shared by every agent in the process
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def _post(self, path: str, data: dict = None) -> dict:
         """POST request, returns parsed JSON."""
-        resp = requests.post(f"{self.base_url}{path}", json=data, timeout=self.timeout)
-        return resp.json()
+        resp = self._session.post(f"{self.base_url}{path}", json=data, timeout=self.timeout)
+        return orjson.loads(resp.content)
 
     def _get(self, path: str) -> dict:
         """GET request, returns parsed JSON."""
-        resp = requests.get(f"{self.base_url}{path}", timeout=self.timeout)
-        return resp.json()
+        resp = self._session.get(f"{self.base_url}{path}", timeout=self.timeout)
+        return orjson.loads(resp.content)
 
     @staticmethod
     def _unwrap(result: dict):
@@ -63,6 +79,21 @@ class WorldClient:
         )
         return result.get("success", False), self._get_error(result)
 
+    def register_machines(self, machines: List[dict]) -> List[Tuple[bool, str]]:
+        """Register several machines in one request.
+
+        Each entry takes register_machine's fields (machine_id and position
+        required). Returns (success, error) per entry, in order.
+        """
+        result = self._post("/api/v1/world/machines/batch", {"machines": machines})
+        if not result.get("success"):
+            error = self._get_error(result)
+            return [(False, error)] * len(machines)
+        return [
+            (r["success"], "" if r["success"] else self._get_error(r))
+            for r in self._unwrap(result)["results"]
+        ]
+
     def machine_action(self, machine_id: str, action: str, params: dict = None) -> dict:
         """Execute a machine action."""
         result = self._post(
@@ -145,24 +176,21 @@ class WorldClient:
 
     def check_collision(self, position: List[float], size: float = 1.0, exclude_id: str = None) -> dict:
         """Simple collision check by fetching all data."""
-        machines = self.get_all_machines()
-        obstacles = self.get_all_obstacles()
-
-        for m_id, m in machines.items():
-            if m_id == exclude_id:
-                continue
-            m_pos = m["position"]
-            dist = sum((a - b) ** 2 for a, b in zip(position, m_pos)) ** 0.5
-            if dist < max(size, m.get("size", 1.0)) * 0.5:
-                return {"collision": True}
-
-        for obs in obstacles.values():
-            obs_pos = obs["position"]
-            dist = sum((a - b) ** 2 for a, b in zip(position, obs_pos)) ** 0.5
-            if dist < max(size, obs.get("size", 1.0)) * 0.5:
-                return {"collision": True}
-
-        return {"collision": False}
+        occupants = self.get_occupants(exclude_id)
+        return {"collision": collides(position, size, occupants)}
+
+    def get_occupants(self, exclude_id: str = None) -> List[Tuple[List[float], float]]:
+        """(position, size) of every machine and obstacle, from one fetch of each."""
+        occupants = [
+            (m["position"], m.get("size", 1.0))
+            for m_id, m in self.get_all_machines().items()
+            if m_id != exclude_id
+        ]
+        occupants.extend(
+            (obs["position"], obs.get("size", 1.0))
+            for obs in self.get_all_obstacles().values()
+        )
+        return occupants
 
     def health_check(self) -> bool:
         """Health check."""
@@ -173,9 +201,9 @@ class WorldClient:
             return False
 
     def get_machine(self, machine_id: str) -> Optional[dict]:
-        """Get a single machine."""
-        machines = self.get_all_machines()
-        return machines.get(machine_id)
+        """Get a single machine (frontend format), or None if it does not exist."""
+        # A 404 envelope carries data=None, which _unwrap passes through
+        return self._unwrap(self._get(f"/api/v1/world/machines/{machine_id}"))
 
 
 # Global client instance
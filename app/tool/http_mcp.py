@@ -1,10 +1,19 @@
+import asyncio
 import os
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from app.logger import logger
 from app.tool.base import BaseTool, ToolResult
 from app.tool.tool_collection import ToolCollection
 
+# Keep-alive connection pool to the MCP server, shared by every agent's tools
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=0)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 class HTTPMCPTool(BaseTool):
     """Proxy tool that invokes MCP tools via HTTP API."""
@@ -15,8 +24,6 @@ class HTTPMCPTool(BaseTool):
     async def execute(self, **kwargs) -> ToolResult:
         """Execute an MCP tool via HTTP API."""
         try:
-            from app.logger import logger
-
             logger.info(
                 f"HTTPMCPTool.execute '{self.tool_name}' with caller_id: "
                 f"'{kwargs.get('caller_id', 'NOT_SET')}'"
@@ -25,14 +32,17 @@ class HTTPMCPTool(BaseTool):
             # Use longer timeout for human command tools (they dispatch to Machine Agents)
             tool_timeout = 180 if "human_send" in self.tool_name else 30
 
-            response = requests.post(
+            # Blocking call runs in a worker thread so parallel tool calls overlap
+            response = await asyncio.to_thread(
+                _session.post,
                 f"{self.server_url}/api/v1/mcp/tools/{self.tool_name}/invoke",
                 json={"parameters": kwargs},
                 timeout=tool_timeout,
             )
 
             if response.status_code == 200:
-                result = response.json()
+                # Decode the raw bytes: skips requests' charset sniffing and str round-trip
+                result = orjson.loads(response.content)
                 data = result.get("data", {}) if result.get("success") else {}
                 return ToolResult(output=data.get("result", ""))
             else:
@@ -61,7 +71,7 @@ class HTTPMCPClients(ToolCollection):
     async def initialize(self) -> None:
         """Initialize the HTTP MCP client by fetching the tool list."""
         try:
-            response = requests.get(
+            response = _session.get(
                 f"{self.server_url}/api/v1/mcp/tools", timeout=10
             )
 
@@ -4,14 +4,37 @@ Tools specific to Human agents for controlling and coordinating machines.
 
 import os
 
+import orjson
 import requests as http_requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
+from app.logger import logger
 from app.tool.base import BaseTool, ToolResult
 
 WORLD_SERVER_URL = os.getenv("WORLD_SERVER_URL", "http://localhost:8005")
 AGENT_SERVER_URL = os.getenv("AGENT_SERVER_URL", "http://localhost:8004")
 
+# Keep-alive connection pool for World Server and Agent Server calls
+_session = http_requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=0)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+
+# shared.response.success_response serializes the envelope compactly in this
+# key order, so the ``data`` text sits between a fixed prefix and suffix
+_ENVELOPE_PREFIX = b'{"success":true,"data":'
+_ENVELOPE_SUFFIX = b',"error":null}'
+
+
+def _data_text(body: bytes) -> str:
+    """Compact JSON text of a World Server envelope's ``data`` (non-ASCII kept as-is)."""
+    if body.startswith(_ENVELOPE_PREFIX) and body.endswith(_ENVELOPE_SUFFIX):
+        # Slice the bytes through instead of decoding the whole world view
+        return body[len(_ENVELOPE_PREFIX):-len(_ENVELOPE_SUFFIX)].decode()
+    return orjson.dumps(orjson.loads(body).get("data", {})).decode()
+
 
 class ListMachinesTool(BaseTool):
     """List all machines with their positions and status."""
@@ -32,15 +55,12 @@ class ListMachinesTool(BaseTool):
 
     async def execute(self, caller_id: str = "", **kwargs) -> ToolResult:
         try:
-            resp = http_requests.get(
+            resp = _session.get(
                 f"{WORLD_SERVER_URL}/api/v1/world/machines",
                 timeout=5,
             )
             if resp.status_code == 200:
-                import json
-
-                data = resp.json().get("data", {})
-                return ToolResult(output=json.dumps(data, ensure_ascii=False))
+                return ToolResult(output=_data_text(resp.content))
             return ToolResult(error=f"Failed to list machines: HTTP {resp.status_code}")
         except Exception as e:
             return ToolResult(error=f"Failed to list machines: {str(e)}")
@@ -65,16 +85,13 @@ class GetWorldViewTool(BaseTool):
 
     async def execute(self, caller_id: str = "", **kwargs) -> ToolResult:
         try:
-            resp = http_requests.get(
+            resp = _session.get(
                 f"{WORLD_SERVER_URL}/api/v1/world/view",
                 params={"human_id": caller_id},
                 timeout=5,
             )
             if resp.status_code == 200:
-                import json
-
-                data = resp.json().get("data", {})
-                return ToolResult(output=json.dumps(data, ensure_ascii=False))
+                return ToolResult(output=_data_text(resp.content))
             return ToolResult(error=f"Failed to get world view: HTTP {resp.status_code}")
         except Exception as e:
             return ToolResult(error=f"Failed to get world view: {str(e)}")
@@ -86,16 +103,13 @@ class BaseMachineControlTool(BaseTool):
     def _get_machine_info_from_world(self, machine_id: str) -> Optional[dict]:
         """Query World Server via HTTP to get machine info."""
         try:
-            resp = http_requests.get(
-                f"{WORLD_SERVER_URL}/api/v1/world/machines",
+            # Fetch just this machine rather than scanning a page of the full list
+            resp = _session.get(
+                f"{WORLD_SERVER_URL}/api/v1/world/machines/{machine_id}",
                 timeout=5,
             )
             if resp.status_code == 200:
-                data = resp.json()
-                items = data.get("data", {}).get("items", [])
-                for machine in items:
-                    if machine.get("machine_id") == machine_id:
-                        return machine
+                return orjson.loads(resp.content).get("data")
             return None
         except Exception:
             return None
@@ -110,7 +124,6 @@ class BaseMachineControlTool(BaseTool):
     ) -> ToolResult:
         """验证机器人状态并执行命令的共享逻辑"""
         try:
-            from app.logger import logger
             mode = "async" if offline else "sync"
             logger.info(f"🔧 {self.name} called ({mode} mode) with caller_id: '{caller_id}' for machine: {machine_id}")
 
@@ -152,10 +165,9 @@ class BaseMachineControlTool(BaseTool):
             caller_id: Caller ID (human_id)
         """
         try:
-            from app.logger import logger
             logger.info(f"Sending command (offline={offline}) for machine {machine_id} via Agent Server")
 
-            resp = http_requests.post(
+            resp = _session.post(
                 f"{AGENT_SERVER_URL}/api/v1/agents/internal/{machine_id}/command",
                 json={
                     "command": command,
@@ -195,7 +195,7 @@ class MCPClients(ToolCollection):
                     logger.error(f"Error disconnecting from server {server_id}: {e}")
         else:
             # Disconnect from all servers in a deterministic order
-            for sid in sorted(list(self.sessions.keys())):
+            for sid in sorted(self.sessions):
                 await self.disconnect(sid)
             self.tool_map = {}
             self.tools = tuple()
@@ -7,12 +7,8 @@ Endpoints:
   POST /tools/<tool_name>/invoke — invoke a tool
 """
 
-import sys
-import os
 import asyncio
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
 from flask import Blueprint, request
 
 from shared.response import success_response, error_response
@@ -37,7 +33,7 @@ def call_tool(tool_name):
     data = request.get_json() or {}
 
     try:
-        req = ToolInvokeRequest(**data)
+        req = ToolInvokeRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
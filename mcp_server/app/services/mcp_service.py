@@ -7,14 +7,9 @@ Tools are distinguished by naming convention: human_* and machine_*.
 """
 
 import json
-import sys
-import os
 from typing import Any, Dict, List, Optional
 from inspect import Parameter, Signature
 
-# 添加项目根目录
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
-
 from mcp.server.fastmcp import FastMCP
 from app.tool.base import BaseTool
 from app.tool.machine_tools import (
@@ -133,10 +128,13 @@ class MCPService:
         tool = self._tools[tool_name]
         result = await tool.execute(**parameters)
 
-        if hasattr(result, "output") and result.output:
-            return result.output
-        if hasattr(result, "error") and result.error:
-            raise Exception(result.error)
+        # getattr with a default: one attribute lookup instead of hasattr + access
+        output = getattr(result, "output", None)
+        if output:
+            return output
+        error = getattr(result, "error", None)
+        if error:
+            raise Exception(error)
         return str(result)
 
     def get_fastmcp_server(self) -> FastMCP:
@@ -10,14 +10,17 @@ import sys
 import os
 import logging
 
-# Add paths
+# Add paths (the service directory, then the project root ahead of it)
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-sys.path.insert(0, os.path.dirname(current_dir))  # project root
+for _path in (current_dir, os.path.dirname(current_dir)):
+    if _path in sys.path:
+        sys.path.remove(_path)
+    sys.path.insert(0, _path)
 
 from flask import Flask
 from flask_cors import CORS
 
+from shared.json_provider import ORJSONProvider
 from mcp_server.app.config import config
 from mcp_server.app.controllers.mcp_controller import mcp_bp
 
@@ -25,6 +28,7 @@ from mcp_server.app.controllers.mcp_controller import mcp_bp
 def create_app() -> Flask:
     """Create the Flask application."""
     flask_app = Flask(__name__)
+    flask_app.json = ORJSONProvider(flask_app)
     CORS(flask_app)
     flask_app.register_blueprint(mcp_bp)
 
@@ -42,18 +46,20 @@ def main():
 
     flask_app = create_app()
 
-    print("=" * 50)
-    print("MCP Server")
-    print("=" * 50)
-    print(f"Address: http://{config.HOST}:{config.PORT}")
-    print(f"World Server: {config.WORLD_SERVER_URL}")
-    print("\nAPI:")
-    print("  GET  /api/v1/mcp/tools                    - List tools")
-    print("  POST /api/v1/mcp/tools/<name>/invoke       - Invoke tool")
-    print("  GET  /health                               - Health check")
-    print("=" * 50)
-    print("\nNote: Start World Server first.")
-    print("Service started\n")
+    print("\n".join([
+        "=" * 50,
+        "MCP Server",
+        "=" * 50,
+        f"Address: http://{config.HOST}:{config.PORT}",
+        f"World Server: {config.WORLD_SERVER_URL}",
+        "\nAPI:",
+        "  GET  /api/v1/mcp/tools                    - List tools",
+        "  POST /api/v1/mcp/tools/<name>/invoke       - Invoke tool",
+        "  GET  /health                               - Health check",
+        "=" * 50,
+        "\nNote: Start World Server first.",
+        "Service started\n",
+    ]), flush=True)
 
     flask_app.run(host=config.HOST, port=config.PORT, debug=False, threaded=True)
 
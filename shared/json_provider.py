@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""orjson-backed JSON provider for Flask apps."""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Parse request bodies and serialize responses with orjson.
+
+    Install with ``app.json = ORJSONProvider(app)``; ``request.get_json()``,
+    ``jsonify`` and dict return values all go through it.
+    """
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype,
+        )
@@ -1,23 +1,45 @@
 # -*- coding: utf-8 -*-
 """Unified API response helpers."""
 
-from flask import jsonify
+import json
+
+from flask import Response, jsonify
+
+# Body of every data-less success response, serialized once at import
+_SUCCESS_NONE_BODY = json.dumps(
+    {"success": True, "data": None, "error": None}, separators=(",", ":")
+).encode()
+
+
+def static_error_body(code, message):
+    """Serialize a fixed error envelope once, for responses sent repeatedly.
+
+    Wrap the bytes in a fresh ``Response`` per request: after-request hooks
+    (CORS) add headers to the response object, so it cannot be shared.
+    """
+    return json.dumps(
+        {"success": False, "data": None, "error": {"code": code, "message": message}},
+        separators=(",", ":"),
+    ).encode()
 
 
 def success_response(data=None, status_code=200):
     """Return a successful JSON response."""
+    if data is None:
+        return Response(_SUCCESS_NONE_BODY, mimetype="application/json"), status_code
     return jsonify({"success": True, "data": data, "error": None}), status_code
 
 
-def error_response(code, message, status_code=400):
-    """Return an error JSON response."""
+def error_response(code, message, status_code=400, details=None):
+    """Return an error JSON response.
+
+    ``details`` carries structured context (e.g. the id that was not found),
+    letting ``message`` stay a fixed string.
+    """
+    error = {"code": code, "message": message}
+    if details is not None:
+        error["details"] = details
     return (
-        jsonify(
-            {
-                "success": False,
-                "data": None,
-                "error": {"code": code, "message": message},
-            }
-        ),
+        jsonify({"success": False, "data": None, "error": error}),
         status_code,
     )
@@ -19,6 +19,12 @@ class MachineRegisterRequest(BaseModel):
     view_size: int = 3
 
 
+class MachineBatchRegisterRequest(BaseModel):
+    """POST /api/v1/world/machines/batch"""
+
+    machines: List[MachineRegisterRequest] = Field(min_length=1, max_length=100)
+
+
 class MachineActionRequest(BaseModel):
     """POST /api/v1/world/machines/<machine_id>/actions"""
 
@@ -49,6 +55,19 @@ class CommandRequest(BaseModel):
     command: str
 
 
+class BatchCommandItem(BaseModel):
+    """One entry of a batch command submission"""
+
+    agent_id: str
+    command: str
+
+
+class BatchCommandRequest(BaseModel):
+    """POST /api/v1/agents/commands/batch"""
+
+    commands: List[BatchCommandItem] = Field(min_length=1, max_length=100)
+
+
 class RegisterRequest(BaseModel):
     """POST /api/v1/auth/register"""
 
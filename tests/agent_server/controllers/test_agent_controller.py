@@ -235,14 +235,8 @@ class TestSendCommand:
     @patch('agent_server.app.controllers.agent_controller.agent_service')
     def test_send_command_success(self, mock_agent_service, mock_task_service, client):
         """测试成功发送命令"""
-        # Mock agent 存在
-        mock_agent_service.get_agent_info.return_value = {
-            'agent_id': 'human_01',
-            'agent_type': 'human'
-        }
-
-        # Mock task_service
-        mock_task_service.submit_command.return_value = 'task-uuid-12345'
+        # Mock task_service（存在性检查已合并到 submit_command）
+        mock_task_service.submit_command.return_value = ('task-uuid-12345', None)
 
         response = client.post(
             '/api/agent/human_01/command',
@@ -270,10 +264,10 @@ class TestSendCommand:
         assert data['success'] is False
         assert 'command is required' in data['error']
 
-    @patch('agent_server.app.controllers.agent_controller.agent_service')
-    def test_send_command_agent_not_found(self, mock_agent_service, client):
+    @patch('agent_server.app.controllers.agent_controller.task_service')
+    def test_send_command_agent_not_found(self, mock_task_service, client):
         """测试 Agent 不存在"""
-        mock_agent_service.get_agent_info.return_value = None
+        mock_task_service.submit_command.return_value = (None, 'Agent non_existent not found')
 
         response = client.post(
             '/api/agent/non_existent/command',
@@ -286,6 +280,94 @@ class TestSendCommand:
         assert 'not found' in data['error'].lower()
 
 
+class TestSendCommandBatch:
+    """测试批量发送命令接口"""
+
+    URL = '/api/v1/agents/commands/batch'
+
+    @staticmethod
+    def _commands(count):
+        return [{'agent_id': f'robot_{i:02d}', 'command': 'scan'} for i in range(count)]
+
+    @patch('agent_server.app.controllers.agent_controller.task_service')
+    def test_send_command_batch_success(self, mock_task_service, client):
+        """测试成功批量提交命令"""
+        mock_task_service.submit_commands.return_value = [
+            {'agent_id': 'human_01', 'task_id': 'task-1', 'error': None},
+            {'agent_id': 'robot_01', 'task_id': 'task-2', 'error': None},
+        ]
+
+        response = client.post(self.URL, json={'commands': [
+            {'agent_id': 'human_01', 'command': 'explore'},
+            {'agent_id': 'robot_01', 'command': 'move forward'},
+        ]})
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['success'] is True
+        assert [t['task_id'] for t in data['data']['tasks']] == ['task-1', 'task-2']
+
+        # 验证调用：按请求顺序传入 (agent_id, command)
+        mock_task_service.submit_commands.assert_called_once_with([
+            ('human_01', 'explore'),
+            ('robot_01', 'move forward'),
+        ])
+
+    @patch('agent_server.app.controllers.agent_controller.task_service')
+    def test_send_command_batch_mixed_results(self, mock_task_service, client):
+        """测试部分 Agent 不存在时逐条返回结果"""
+        mock_task_service.submit_commands.return_value = [
+            {'agent_id': 'robot_01', 'task_id': 'task-1', 'error': None},
+            {'agent_id': 'ghost', 'task_id': None, 'error': 'Agent ghost not found'},
+        ]
+
+        response = client.post(self.URL, json={'commands': [
+            {'agent_id': 'robot_01', 'command': 'scan'},
+            {'agent_id': 'ghost', 'command': 'scan'},
+        ]})
+
+        assert response.status_code == 200
+        tasks = response.get_json()['data']['tasks']
+        assert tasks[0] == {'agent_id': 'robot_01', 'task_id': 'task-1', 'error': None}
+        assert tasks[1]['task_id'] is None
+        assert 'not found' in tasks[1]['error']
+
+    @pytest.mark.parametrize('count', [1, 100])
+    @patch('agent_server.app.controllers.agent_controller.task_service')
+    def test_send_command_batch_size_limits_accepted(self, mock_task_service, count, client):
+        """测试 1 条和 100 条（上下限）均可提交"""
+        mock_task_service.submit_commands.side_effect = lambda commands: [
+            {'agent_id': agent_id, 'task_id': f'task-{agent_id}', 'error': None}
+            for agent_id, _ in commands
+        ]
+
+        response = client.post(self.URL, json={'commands': self._commands(count)})
+
+        assert response.status_code == 200
+        assert len(response.get_json()['data']['tasks']) == count
+
+    @pytest.mark.parametrize('count', [0, 101])
+    @patch('agent_server.app.controllers.agent_controller.task_service')
+    def test_send_command_batch_size_limits_rejected(self, mock_task_service, count, client):
+        """测试 0 条和 101 条（超出上下限）被拒绝，且不提交任何任务"""
+        response = client.post(self.URL, json={'commands': self._commands(count)})
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert data['error']['code'] == 'VALIDATION_ERROR'
+        mock_task_service.submit_commands.assert_not_called()
+
+    @patch('agent_server.app.controllers.agent_controller.task_service')
+    def test_send_command_batch_missing_commands(self, mock_task_service, client):
+        """测试缺少 commands 字段"""
+        response = client.post(self.URL, json={})
+
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+        mock_task_service.submit_commands.assert_not_called()
+
+
 class TestGetTaskStatus:
     """测试查询任务状态接口"""
 
@@ -345,18 +427,21 @@ class TestListAgents:
     @patch('agent_server.app.controllers.agent_controller.agent_service')
     def test_list_agents_success(self, mock_agent_service, client):
         """测试成功获取 Agent 列表"""
-        mock_agent_service.get_all_agents.return_value = {
-            'human_01': {
-                'agent_id': 'human_01',
-                'agent_type': 'human',
-                'status': 'active'
-            },
-            'robot_01': {
-                'agent_id': 'robot_01',
-                'agent_type': 'machine',
-                'owner_id': 'human_01'
-            }
-        }
+        mock_agent_service.get_agents_page.return_value = (
+            [
+                {
+                    'agent_id': 'human_01',
+                    'agent_type': 'human',
+                    'status': 'active'
+                },
+                {
+                    'agent_id': 'robot_01',
+                    'agent_type': 'machine',
+                    'owner_id': 'human_01'
+                }
+            ],
+            2
+        )
 
         response = client.get('/api/agent')
 
@@ -367,12 +452,12 @@ class TestListAgents:
         assert len(data['agents']) == 2
 
         # 验证调用
-        mock_agent_service.get_all_agents.assert_called_once()
+        mock_agent_service.get_agents_page.assert_called_once()
 
     @patch('agent_server.app.controllers.agent_controller.agent_service')
     def test_list_agents_empty(self, mock_agent_service, client):
         """测试空 Agent 列表"""
-        mock_agent_service.get_all_agents.return_value = {}
+        mock_agent_service.get_agents_page.return_value = ([], 0)
 
         response = client.get('/api/agent')
 
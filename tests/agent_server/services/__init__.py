@@ -0,0 +1 @@
+# Agent Service Tests
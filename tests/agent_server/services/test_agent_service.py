@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Agent Service 测试
+
+测试 AgentService.get_agents_page 的分页：先排 Human，再排 Machine
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# 添加项目路径（和 controllers/test_agent_controller.py 一样的方式）
+# 项目根目录必须在最前面，这样 app 才会指向根目录的 app 包
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(1, str(project_root / 'agent_server'))
+
+HUMAN_IDS = ['human_01', 'human_02']
+MACHINE_IDS = ['robot_01', 'robot_02', 'robot_03']
+
+
+@pytest.fixture
+def service_module():
+    """延迟导入 agent_service 模块（services 包把同名属性导出成了实例，所以从 sys.modules 取）"""
+    import agent_server.app.services.agent_service  # noqa: F401
+    return sys.modules['agent_server.app.services.agent_service']
+
+
+@pytest.fixture
+def managers(service_module):
+    """Mock HumanManager / MachineManager，Human 2 个、Machine 3 个"""
+    human_manager = MagicMock()
+    human_manager.get_ids.return_value = list(HUMAN_IDS)
+    human_manager.get_info.side_effect = lambda agent_id: {'agent_id': agent_id}
+
+    machine_manager = MagicMock()
+    machine_manager.get_ids.return_value = list(MACHINE_IDS)
+    machine_manager.get_many.side_effect = lambda ids: {i: {'agent_id': i} for i in ids}
+
+    with patch.object(service_module, 'human_manager', human_manager), \
+            patch.object(service_module, 'machine_manager', machine_manager):
+        yield human_manager, machine_manager
+
+
+@pytest.fixture
+def service(service_module, managers):
+    """每个测试使用新的 AgentService 实例"""
+    return service_module.AgentService()
+
+
+class TestGetAgentsPage:
+    """测试 get_agents_page 在 Human / Machine 边界上的 offset 拆分"""
+
+    @pytest.mark.parametrize('offset, limit, expected', [
+        # offset 落在 Human 内
+        (0, 2, ['human_01', 'human_02']),
+        (1, 1, ['human_02']),
+        # 跨越 Human 与 Machine
+        (1, 3, ['human_02', 'robot_01', 'robot_02']),
+        (0, 10, HUMAN_IDS + MACHINE_IDS),
+        # 恰好从第一个 Machine 开始 / 落在 Machine 内
+        (2, 2, ['robot_01', 'robot_02']),
+        (4, 10, ['robot_03']),
+        # 超出末尾
+        (5, 3, []),
+        (50, 3, []),
+    ])
+    def test_page_items(self, service, offset, limit, expected):
+        """测试各 offset / limit 组合返回的条目与总数"""
+        items, total = service.get_agents_page(offset, limit)
+
+        assert [item['agent_id'] for item in items] == expected
+        assert total == len(HUMAN_IDS) + len(MACHINE_IDS)
+
+    def test_page_within_humans_skips_world_server(self, service, managers):
+        """测试整页都是 Human 时不查询 Machine 状态"""
+        _, machine_manager = managers
+
+        service.get_agents_page(0, 2)
+
+        machine_manager.get_many.assert_not_called()
+
+    def test_page_only_fetches_page_machines(self, service, managers):
+        """测试只为本页的 Machine 查询状态"""
+        _, machine_manager = managers
+
+        service.get_agents_page(1, 3)
+
+        machine_manager.get_many.assert_called_once_with(['robot_01', 'robot_02'])
+
+    @pytest.mark.parametrize('offset', [0, 2, 5])
+    def test_limit_zero(self, service, managers, offset):
+        """测试 limit=0 返回空页但仍给出总数"""
+        human_manager, machine_manager = managers
+
+        items, total = service.get_agents_page(offset, 0)
+
+        assert items == []
+        assert total == len(HUMAN_IDS) + len(MACHINE_IDS)
+        human_manager.get_info.assert_not_called()
+        machine_manager.get_many.assert_not_called()
+
+    def test_missing_human_info_is_skipped(self, service, managers):
+        """测试 Human 在取 ID 后被删除（get_info 返回 None）时跳过该条"""
+        human_manager, _ = managers
+        human_manager.get_info.side_effect = lambda agent_id: None if agent_id == 'human_01' else {'agent_id': agent_id}
+
+        items, _ = service.get_agents_page(0, 3)
+
+        assert [item['agent_id'] for item in items] == ['human_02', 'robot_01']
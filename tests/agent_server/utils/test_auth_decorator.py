@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Auth Decorator 测试
+
+测试 require_api_key 对 Bearer 头的解析，包括带 "=" 的 API Key
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+# 添加项目路径（和 services/test_agent_service.py 一样的方式）
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(1, str(project_root / 'agent_server'))
+
+import agent_server.app.utils.auth_decorator as auth_decorator_module  # noqa: E402
+
+# conftest 会在测试运行前把 require_api_key 换成 mock，这里在收集阶段先保存真实装饰器
+require_api_key = auth_decorator_module.require_api_key
+
+VALID_KEYS = {
+    'sk-plain': 'user_01',
+    'sk-padded==': 'user_02',
+    'sk-a=b==': 'user_03',
+}
+
+
+@pytest.fixture
+def client():
+    """只挂一个受保护接口的 Flask 应用，verify_api_key 按 VALID_KEYS 校验"""
+    app = Flask(__name__)
+
+    @app.route('/protected')
+    @require_api_key
+    def protected(user_id):
+        return {'user_id': user_id}
+
+    def verify_api_key(api_key):
+        user_id = VALID_KEYS.get(api_key)
+        return user_id is not None, user_id
+
+    auth_service = MagicMock()
+    auth_service.verify_api_key.side_effect = verify_api_key
+    with patch.object(auth_decorator_module, 'auth_service', auth_service):
+        yield app.test_client()
+
+
+class TestRequireApiKey:
+    """测试 require_api_key 的 Authorization 头处理"""
+
+    @pytest.mark.parametrize('api_key, user_id', list(VALID_KEYS.items()))
+    def test_valid_key(self, client, api_key, user_id):
+        """合法 Key（包括带 "=" 填充或中间带 "=" 的）通过校验"""
+        response = client.get('/protected', headers={'Authorization': f'Bearer {api_key}'})
+        assert response.status_code == 200
+        assert response.get_json() == {'user_id': user_id}
+
+    def test_lowercase_scheme(self, client):
+        """scheme 不区分大小写"""
+        response = client.get('/protected', headers={'Authorization': 'bearer  sk-a=b== '})
+        assert response.status_code == 200
+        assert response.get_json() == {'user_id': 'user_03'}
+
+    @pytest.mark.parametrize('headers, code', [
+        ({}, 'API_KEY_MISSING'),
+        ({'Authorization': 'Bearer'}, 'BEARER_PREFIX_REQUIRED'),
+        ({'Authorization': 'Token sk-plain'}, 'BEARER_PREFIX_REQUIRED'),
+        ({'Authorization': 'Bearer sk-other=='}, 'API_KEY_INVALID'),
+    ])
+    def test_rejected(self, client, headers, code):
+        """缺少头、缺少 Bearer 前缀或 Key 无效时返回 401"""
+        response = client.get('/protected', headers=headers)
+        assert response.status_code == 401
+        assert response.get_json()['error']['code'] == code
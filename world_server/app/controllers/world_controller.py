@@ -4,11 +4,13 @@ World Controller — core API for world state management.
 
 Endpoints:
   POST /machines                     — register a machine
+  POST /machines/batch               — register several machines
   POST /machines/<machine_id>/actions — execute an action
   POST /state                        — persist world state
   GET  /machines/<machine_id>/view   — get machine field-of-view
   GET  /view                         — get fog-of-war filtered view for a player
   GET  /machines                     — list machines (paginated)
+  GET  /machines/<machine_id>        — get a single machine
   GET  /obstacles                    — list obstacles
   GET  /carried-resources            — list carried resources
   GET  /debug/*                      — debug helpers
@@ -17,14 +19,19 @@ Endpoints:
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+# world_server runs with its own directory on sys.path; shared/ lives at the root
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from flask import Blueprint, request
 
 from shared.response import success_response, error_response
 from shared.pagination import get_pagination_params, paginated_response
 from shared import error_codes as EC
-from shared.validation import MachineRegisterRequest, MachineActionRequest
+from shared.validation import (
+    MachineRegisterRequest, MachineBatchRegisterRequest, MachineActionRequest
+)
 
 from ..services.world_service import world_service
 
@@ -41,7 +48,7 @@ def machine_register():
         return error_response(EC.VALIDATION_ERROR, "Request body is required")
 
     try:
-        req = MachineRegisterRequest(**data)
+        req = MachineRegisterRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
@@ -59,14 +66,51 @@ def machine_register():
         return success_response(
             {"machine_id": req.machine_id, "position": req.position}, 201
         )
+    return error_response(_register_error_code(error), error)
 
-    # Map service-level error strings to error codes
-    code = EC.VALIDATION_ERROR
+
+@world_bp.route("/machines/batch", methods=["POST"])
+def machine_register_batch():
+    """Register several machines in one request; results are per machine."""
+    data = request.get_json()
+    if not data:
+        return error_response(EC.VALIDATION_ERROR, "Request body is required")
+
+    try:
+        req = MachineBatchRegisterRequest.model_validate(data)
+    except Exception as e:
+        return error_response(EC.VALIDATION_ERROR, str(e))
+
+    outcomes = world_service.register_machines([
+        {
+            "machine_id": m.machine_id,
+            "position": m.position,
+            "owner": m.owner,
+            "life_value": m.life_value,
+            "machine_type": m.machine_type,
+            "size": m.size,
+            "facing_direction": tuple(m.facing_direction),
+            "view_size": m.view_size,
+        }
+        for m in req.machines
+    ])
+    results = [
+        {"machine_id": m.machine_id, "success": True}
+        if success
+        else {"machine_id": m.machine_id, "success": False,
+              "error": {"code": _register_error_code(error), "message": error}}
+        for m, (success, error) in zip(req.machines, outcomes)
+    ]
+    return success_response({"results": results})
+
+
+def _register_error_code(error: str) -> str:
+    """Map service-level registration error strings to error codes."""
     if "already exists" in error:
-        code = EC.MACHINE_ALREADY_EXISTS
-    elif "collision" in error.lower():
-        code = EC.POSITION_COLLISION
-    return error_response(code, error)
+        return EC.MACHINE_ALREADY_EXISTS
+    if "collision" in error.lower():
+        return EC.POSITION_COLLISION
+    return EC.VALIDATION_ERROR
 
 
 @world_bp.route("/machines/<machine_id>/actions", methods=["POST"])
@@ -77,7 +121,7 @@ def machine_action(machine_id):
         return error_response(EC.VALIDATION_ERROR, "Request body is required")
 
     try:
-        req = MachineActionRequest(**data)
+        req = MachineActionRequest.model_validate(data)
     except Exception as e:
         return error_response(EC.VALIDATION_ERROR, str(e))
 
@@ -130,6 +174,15 @@ def get_machines():
     return success_response(paginated_response(items, total, page, limit))
 
 
+@world_bp.route("/machines/<machine_id>", methods=["GET"])
+def get_machine(machine_id):
+    """Get a single machine (frontend format)."""
+    result = world_service.get_machine_for_frontend(machine_id)
+    if result:
+        return success_response(result)
+    return error_response(EC.MACHINE_NOT_FOUND, f"Machine {machine_id} not found", 404)
+
+
 @world_bp.route("/obstacles", methods=["GET"])
 def get_obstacles():
     """List all obstacles (frontend format)."""
@@ -92,34 +92,60 @@ class WorldService:
     ) -> Tuple[bool, str]:
         """Register a machine"""
         with self._data_lock:
-            if machine_id in self._machines:
-                return False, "Machine already exists"
-
-            pos = Position(*position)
-            if self._collision_service.check_collision(pos, size):
-                return False, "Position has collision"
-
-            # Ensure view_size is odd and at least 1
-            view_size = max(1, int(view_size))
-            if view_size % 2 == 0:
-                view_size += 1
-
-            machine = MachineInfo(
-                machine_id=machine_id,
-                position=pos,
-                life_value=life_value,
-                machine_type=machine_type,
-                owner=owner,
-                size=size,
-                facing_direction=facing_direction,
-                view_size=view_size,
+            return self._register_locked(
+                machine_id, position, owner, life_value,
+                machine_type, size, facing_direction, view_size
             )
-            self._machines[machine_id] = machine.to_dict()
 
-            # Create command queue for the new machine
-            command_queue_service.create_queue(machine_id)
+    def register_machines(self, specs: List[dict]) -> List[Tuple[bool, str]]:
+        """Register several machines under one lock acquisition
+
+        Each spec holds register_machine keyword arguments; results are in
+        spec order. Machines earlier in the batch count for later collisions.
+        """
+        with self._data_lock:
+            return [self._register_locked(**spec) for spec in specs]
 
-            return True, ""
+    def _register_locked(
+        self,
+        machine_id: str,
+        position: List[float],
+        owner: str = "",
+        life_value: int = config.DEFAULT_LIFE_VALUE,
+        machine_type: str = config.DEFAULT_MACHINE_TYPE,
+        size: float = config.DEFAULT_SIZE,
+        facing_direction: Tuple[float, float] = (1.0, 0.0),
+        view_size: int = config.DEFAULT_VIEW_SIZE
+    ) -> Tuple[bool, str]:
+        """Register one machine (caller holds _data_lock)"""
+        if machine_id in self._machines:
+            return False, "Machine already exists"
+
+        pos = Position(*position)
+        if self._collision_service.check_collision(pos, size):
+            return False, "Position has collision"
+
+        # Ensure view_size is odd and at least 1
+        view_size = max(1, int(view_size))
+        if view_size % 2 == 0:
+            view_size += 1
+
+        machine = MachineInfo(
+            machine_id=machine_id,
+            position=pos,
+            life_value=life_value,
+            machine_type=machine_type,
+            owner=owner,
+            size=size,
+            facing_direction=facing_direction,
+            view_size=view_size,
+        )
+        self._machines[machine_id] = machine.to_dict()
+
+        # Create command queue for the new machine
+        command_queue_service.create_queue(machine_id)
+
+        return True, ""
 
     def _execute_action_internal(self, machine_id: str, action: str, params: dict) -> dict:
         """
@@ -201,7 +227,7 @@ class WorldService:
         with self._data_lock:
             count = len(self._machines)
             # Clean up all command queues
-            for machine_id in list(self._machines.keys()):
+            for machine_id in self._machines:
                 command_queue_service.remove_queue(machine_id)
             self._machines.clear()
             self._obstacles.clear()
@@ -215,6 +241,14 @@ class WorldService:
 
     # ==================== Frontend Data API ====================
 
+    def get_machine_for_frontend(self, machine_id: str) -> Optional[dict]:
+        """Get a single machine's data (frontend format)"""
+        with self._data_lock:
+            machine = self._machines.get(machine_id)
+            if machine is None:
+                return None
+            return self._serializer.serialize_machines({machine_id: machine})[0]
+
     def get_machines_for_frontend(self) -> List[dict]:
         """Get all machine data (frontend format)"""
         with self._data_lock:
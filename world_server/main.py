@@ -12,9 +12,19 @@ Core API:
 """
 
 import logging
+import os
+import sys
+
+# Project root (for shared/) goes after this service's directory, so that
+# `app` keeps resolving to world_server/app rather than the root app package
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
 from flask import Flask
 from flask_cors import CORS
 
+from shared.json_provider import ORJSONProvider
 from app.config import config
 from app.controllers.world_controller import world_bp
 
@@ -22,6 +32,7 @@ from app.controllers.world_controller import world_bp
 def create_app() -> Flask:
     """Create the Flask application."""
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     CORS(app)
 
     # Register world controller
@@ -41,26 +52,30 @@ def main():
 
     app = create_app()
 
-    print("=" * 50)
-    print("World Server")
-    print("=" * 50)
-    print(f"Address: http://{config.HOST}:{config.PORT}")
-    print("\nCore API:")
-    print("  POST /api/v1/world/machines                  - Register machine")
-    print("  POST /api/v1/world/machines/<id>/actions      - Execute action")
-    print("  POST /api/v1/world/state                      - Save world")
-    print("  GET  /api/v1/world/machines/<id>/view         - Machine view")
-    print("\nFrontend API:")
-    print("  GET  /api/v1/world/view                       - Fog-of-war view")
-    print("  GET  /api/v1/world/machines                   - List machines")
-    print("  GET  /api/v1/world/obstacles                  - List obstacles")
-    print("  GET  /api/v1/world/carried-resources          - Carried resources")
-    print("\nDebug API:")
-    print("  GET  /api/v1/world/debug/machines             - Raw machines")
-    print("  GET  /api/v1/world/debug/obstacles            - Raw obstacles")
-    print("  POST /api/v1/world/debug/reset                - Reset world")
-    print("=" * 50)
-    print("Service started\n")
+    print("\n".join([
+        "=" * 50,
+        "World Server",
+        "=" * 50,
+        f"Address: http://{config.HOST}:{config.PORT}",
+        "\nCore API:",
+        "  POST /api/v1/world/machines                  - Register machine",
+        "  POST /api/v1/world/machines/batch            - Register machines",
+        "  POST /api/v1/world/machines/<id>/actions      - Execute action",
+        "  POST /api/v1/world/state                      - Save world",
+        "  GET  /api/v1/world/machines/<id>/view         - Machine view",
+        "\nFrontend API:",
+        "  GET  /api/v1/world/view                       - Fog-of-war view",
+        "  GET  /api/v1/world/machines                   - List machines",
+        "  GET  /api/v1/world/machines/<id>              - Get machine",
+        "  GET  /api/v1/world/obstacles                  - List obstacles",
+        "  GET  /api/v1/world/carried-resources          - Carried resources",
+        "\nDebug API:",
+        "  GET  /api/v1/world/debug/machines             - Raw machines",
+        "  GET  /api/v1/world/debug/obstacles            - Raw obstacles",
+        "  POST /api/v1/world/debug/reset                - Reset world",
+        "=" * 50,
+        "Service started\n",
+    ]), flush=True)
 
     app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG)
 